@@ -10,28 +10,38 @@ Sprint 7 Enhancement: End-to-End Integration
 
 import streamlit as st
 import os
+import dataclasses
+import hashlib
 import sys
+import threading
 import json
 import time
 import logging
 import traceback
 from pathlib import Path
 from datetime import datetime
+from collections import deque
+from itertools import islice, zip_longest
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Any, Tuple
 
-# Add src to path for imports
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+# Add src to path for imports (once; Streamlit re-executes this script on every rerun)
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
 from src.config import get_config
 from src.parsers.email_parser import EmailParser
-from src.processors.cpra_analyzer import CPRAAnalyzer
-from src.processors.review_manager import ReviewManager
 from src.processors.session_manager import SessionManager
-from src.processors.export_manager import ExportManager
 from src.utils.data_structures import (
     Email, ProcessingSession, ResponsivenessAnalysis,
     ExemptionAnalysis, DocumentReview, ExemptionType,
-    ReviewStatus, CPRARequest
+    ReviewStatus, CPRARequest, ConfidenceLevel
 )
 from src.utils.demo_utils import (
     check_network_connectivity, get_system_resources,
@@ -41,18 +51,41 @@ from src.utils.demo_utils import (
     create_demo_sidebar_controls, show_model_activity_indicator,
     create_phase_indicator
 )
-from src.components.resource_monitor import (
-    ResourceMonitor, create_performance_gauge,
-    create_model_comparison_chart
-)
-from src.components.llm_stream_display import (
-    LLMStreamDisplay, StreamCallback, create_llm_stream_display
-)
 from src.styles.custom_styles import apply_custom_styling
 
 # Initialize configuration
 config = get_config()
 
+# Documents listed per page in the results dashboard groups
+RESULTS_PAGE_SIZE = 25
+
+# Demo-mode stream events kept for the AI stream view; older ones are dropped
+STREAM_EVENT_LIMIT = 64
+
+# Characters of each logged stream event kept; the latest prompt and response
+# of each type are stored in full for the last-interaction panel
+STREAM_EVENT_CONTENT_LIMIT = 2048
+
+# Analysis results remembered per session for identical emails; oldest dropped first
+ANALYSIS_MEMO_LIMIT = 4096
+
+# Seconds between reruns that check on a running export
+EXPORT_POLL_INTERVAL = 0.5
+
+# Stream event types shown in the last-interaction panel
+LAST_INTERACTION_EVENT_TYPES = ('system_prompt', 'user_prompt', 'response_complete')
+
+# Exemption choices: (type, label, ExemptionAnalysis field)
+EXEMPTION_OPTIONS = (
+    (ExemptionType.ATTORNEY_CLIENT, "Attorney-Client Privilege", "attorney_client"),
+    (ExemptionType.PERSONNEL, "Personnel Records", "personnel"),
+    (ExemptionType.DELIBERATIVE, "Deliberative Process", "deliberative"),
+)
+EXEMPTION_LABELS = {exemption_type: label for exemption_type, label, _ in EXEMPTION_OPTIONS}
+# Keyed on enum values: analyzer results carry ExemptionType members from
+# utils.data_structures, a different class from the one imported here
+EXEMPTION_FIELDS = {exemption_type.value: (field_name, label) for exemption_type, label, field_name in EXEMPTION_OPTIONS}
+
 # Setup logging
 logging.basicConfig(
     level=getattr(logging, config.logging.log_level),
@@ -63,52 +96,151 @@ logger = logging.getLogger(__name__)
 
 def init_session_state():
     """Initialize Streamlit session state variables."""
-    if 'session' not in st.session_state:
-        st.session_state.session = None
-    if 'emails' not in st.session_state:
-        st.session_state.emails = []
-    if 'cpra_requests' not in st.session_state:
-        st.session_state.cpra_requests = []
-    if 'responsiveness_results' not in st.session_state:
-        st.session_state.responsiveness_results = []
-    if 'exemption_results' not in st.session_state:
-        st.session_state.exemption_results = []
-    if 'review_manager' not in st.session_state:
-        st.session_state.review_manager = None
-    if 'current_review_index' not in st.session_state:
-        st.session_state.current_review_index = 0
-    if 'processing_complete' not in st.session_state:
-        st.session_state.processing_complete = False
-    if 'review_complete' not in st.session_state:
-        st.session_state.review_complete = False
-    if 'page' not in st.session_state:
-        st.session_state.page = 'upload'
-    if 'export_manager' not in st.session_state:
-        st.session_state.export_manager = None
-    # Demo mode settings from config
-    if 'demo_mode' not in st.session_state:
-        st.session_state.demo_mode = config.demo.enable_by_default
-    if 'demo_settings' not in st.session_state:
-        st.session_state.demo_settings = {
+    defaults = {
+        'session': None,
+        'emails': [],
+        'cpra_requests': [],
+        'responsiveness_results': [],
+        'exemption_results': [],
+        'review_manager': None,
+        'current_review_index': 0,
+        'processing_complete': False,
+        'review_complete': False,
+        'page': 'upload',
+        # Revision counters: processing bumps results_version and saving a
+        # review bumps review_version. The cached aggregates below are
+        # recomputed only when their revision changes.
+        'results_version': 0,
+        'review_version': 0,
+        'result_groups': None,
+        'email_fields': None,
+        'review_summary': None,
+        'final_counts': None,
+        # Analysis results keyed by model, prompt inputs and email digest
+        'analysis_memo': {},
+        'export_result': None,
+        'export_job': None,
+        'export_request': None,
+        # Demo mode settings from config
+        'demo_mode': config.demo.enable_by_default,
+        'demo_settings': {
             'speed': config.demo.default_speed,
             'animations': config.demo.show_animations,
             'resource_monitor': config.demo.show_resource_monitor,
             'typewriter': config.demo.typewriter_effect
-        }
-    if 'resource_monitor' not in st.session_state:
-        st.session_state.resource_monitor = ResourceMonitor()
-    # LLM streaming display
-    if 'llm_display' not in st.session_state:
-        st.session_state.llm_display = None
-    if 'stream_callback' not in st.session_state:
-        st.session_state.stream_callback = None
-    if 'stream_events' not in st.session_state:
-        st.session_state.stream_events = []
-    if 'current_stream' not in st.session_state:
-        st.session_state.current_stream = {}
-    # Error state
-    if 'last_error' not in st.session_state:
-        st.session_state.last_error = None
+        },
+        # LLM streaming display
+        'llm_display': None,
+        'stream_callback': None,
+        'stream_events': deque(maxlen=STREAM_EVENT_LIMIT),
+        'last_stream_events': {},
+        'current_stream': {},
+        # Error state
+        'last_error': None
+    }
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _read_text_file(path: str, mtime: float) -> str:
+    """
+    Read a text file, cached per path and modification time across reruns.
+    
+    Each edit to the file adds a new (path, mtime) entry, so the cache is
+    bounded to keep superseded copies from accumulating.
+    """
+    return Path(path).read_text(encoding='utf-8')
+
+
+@st.cache_resource(show_spinner=False)
+def _get_email_parser() -> EmailParser:
+    """Return a parser instance shared across reruns and sessions."""
+    return EmailParser()
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_manager() -> SessionManager:
+    """Return the session manager shared across reruns and sessions."""
+    return SessionManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer(model_name: str):
+    """
+    Return the analyzer for a model, shared across reruns and sessions.
+    
+    Construction checks Ollama connectivity and lists the installed models,
+    so it runs once per model. A failed construction raises and is not
+    cached, so the next run retries.
+    
+    Args:
+        model_name: Name of the Ollama model to use for analysis
+        
+    Returns:
+        CPRAAnalyzer instance
+    """
+    from src.processors.cpra_analyzer import CPRAAnalyzer
+    return CPRAAnalyzer(model_name=model_name)
+
+
+@st.cache_resource(show_spinner=False)
+def get_resource_monitor():
+    """
+    Return the resource monitor shared by every session, starting its
+    sampler thread the first time the monitor is shown.
+    
+    Returns:
+        ResourceMonitor instance
+    """
+    from src.components.resource_monitor import ResourceMonitor
+    return ResourceMonitor()
+
+
+@st.cache_resource(show_spinner=False)
+def get_export_pool() -> ThreadPoolExecutor:
+    """Return the thread pool that renders export files, shared across sessions."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_io_pool() -> ThreadPoolExecutor:
+    """Return the single-threaded pool for session file writes, shared across sessions."""
+    # One worker serializes saves so concurrent clicks cannot interleave writes
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-io")
+
+
+@st.cache_resource(show_spinner=False)
+def get_export_manager(output_dir: str):
+    """
+    Return the export manager for an output directory, shared across reruns
+    and sessions.
+    
+    Args:
+        output_dir: Directory for storing exported files
+        
+    Returns:
+        ExportManager instance
+    """
+    # Deferred: pulls in reportlab, which only the export page needs
+    from src.processors.export_manager import ExportManager
+    return ExportManager(output_dir=output_dir)
+
+
+@st.cache_data(max_entries=4, show_spinner="Parsing emails...")
+def _parse_emails_cached(content_hash: str, _content: str) -> List[Email]:
+    """
+    Parse email content, cached by content hash so reruns skip re-parsing.
+    
+    Args:
+        content_hash: Digest of the content, used as the cache key
+        _content: Raw email text (underscore-prefixed so Streamlit does not
+            hash it a second time)
+        
+    Returns:
+        List of parsed Email objects
+    """
+    return _get_email_parser().parse_email_file(_content)
 
 
 def load_sample_data() -> Optional[str]:
@@ -116,8 +248,7 @@ def load_sample_data() -> Optional[str]:
     try:
         sample_file_path = Path("data/sample_emails/test_emails.txt")
         if sample_file_path.exists():
-            with open(sample_file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_text_file(str(sample_file_path), sample_file_path.stat().st_mtime)
     except Exception as e:
         logger.error(f"Error loading sample data: {e}")
         st.session_state.last_error = f"Failed to load sample data: {str(e)}"
@@ -127,11 +258,11 @@ def load_sample_data() -> Optional[str]:
 def parse_emails(content: str) -> List[Email]:
     """Parse email content into Email objects with error handling."""
     try:
-        parser = EmailParser()
         # Add debug logging
         logger.debug(f"Parsing content of length: {len(content)}")
         logger.debug(f"First 100 chars: {content[:100] if content else 'Empty'}")
-        emails = parser.parse_email_file(content)
+        content_hash = hashlib.blake2b(content.encode('utf-8')).hexdigest()
+        emails = _parse_emails_cached(content_hash, content)
         logger.info(f"Successfully parsed {len(emails)} emails")
         return emails
     except Exception as e:
@@ -140,6 +271,374 @@ def parse_emails(content: str) -> List[Email]:
         return []
 
 
+def iter_analysis_results(analyze_fn, indices: List[int], max_workers: int = 1):
+    """
+    Run an analysis function over email indices, yielding results as they finish.
+    
+    Analysis calls are I/O-bound round-trips to Ollama, so with more than one
+    worker they run on a thread pool and are yielded in completion order.
+    Streamlit updates stay on the calling thread, which consumes the results.
+    
+    Args:
+        analyze_fn: Function taking an email index and returning a result
+        indices: Email indices to analyze
+        max_workers: Maximum number of concurrent analysis calls
+        
+    Yields:
+        Tuple of (index, result, error) where error is None on success
+    """
+    if max_workers <= 1:
+        for i in indices:
+            try:
+                yield i, analyze_fn(i), None
+            except Exception as e:
+                yield i, None, e
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(analyze_fn, i): i for i in indices}
+        yield from iter_completed(futures)
+    finally:
+        # A run abandoned by a rerun or error must not wait out the queued calls
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def within_budget(fn, budget: threading.Semaphore):
+    """
+    Wrap a function so each call holds a slot of a shared budget while it runs.
+    
+    Args:
+        fn: Function to wrap
+        budget: Semaphore shared by every caller that draws on the budget
+        
+    Returns:
+        Wrapped function
+    """
+    def run(*args):
+        with budget:
+            return fn(*args)
+    return run
+
+
+def iter_completed(futures: Dict[Future, int]):
+    """
+    Yield already-submitted analysis futures as they finish.
+    
+    Args:
+        futures: Mapping of submitted futures to their email index
+        
+    Yields:
+        Tuple of (index, result, error) where error is None on success
+    """
+    for future in as_completed(futures):
+        i = futures[future]
+        try:
+            yield i, future.result(), None
+        except Exception as e:
+            yield i, None, e
+
+
+def iter_batched_analysis_results(analyze_batch_fn, indices: List[int], batch_size: int, max_workers: int = 1):
+    """
+    Run a multi-email analysis function over groups of indices, yielding per email.
+    
+    Args:
+        analyze_batch_fn: Function taking a list of email indices and returning
+            a list of results in the same order
+        indices: Email indices to analyze
+        batch_size: Number of emails analyzed per call
+        max_workers: Maximum number of concurrent analysis calls
+        
+    Yields:
+        Tuple of (index, result, error) where error is None on success
+    """
+    indices = list(indices)
+    batches = [indices[start:start + batch_size] for start in range(0, len(indices), batch_size)]
+    
+    batch_stream = iter_analysis_results(lambda b: analyze_batch_fn(batches[b]), range(len(batches)), max_workers)
+    for b, results, error in batch_stream:
+        if error is not None:
+            results = [None] * len(batches[b])
+        for i, result in zip(batches[b], results):
+            yield i, result, error
+
+
+def get_email_fields() -> Dict[str, List[str]]:
+    """
+    Get per-email display fields, derived once per uploaded email list.
+    
+    Returns:
+        Dictionary with 'ids' (message ID, or the email_N fallback the
+        analyzer and review manager use) and 'subjects' lists, indexed like
+        st.session_state.emails
+    """
+    emails = st.session_state.emails
+    cached = st.session_state.email_fields
+    # The cache holds the list itself, so an identity check cannot match a new upload
+    if cached is not None and cached[0] is emails:
+        return cached[1]
+    
+    fields = {
+        'ids': [email.message_id or f"email_{i}" for i, email in enumerate(emails)],
+        'subjects': [email.subject or '(No subject)' for email in emails]
+    }
+    st.session_state.email_fields = (emails, fields)
+    return fields
+
+
+def get_result_groups() -> Dict[str, Any]:
+    """
+    Group email indices by analysis outcome, reusing the last grouping until
+    the results change.
+    
+    The grouping is cached in session state and keyed by results_version,
+    which processing_page bumps whenever it finishes a run.
+    
+    Returns:
+        Dictionary with 'responsive', 'non_responsive', 'exemptions',
+        'high_conf', 'medium_conf' and 'low_conf' index lists
+    """
+    groups = st.session_state.result_groups
+    if groups is not None and groups['version'] == st.session_state.results_version:
+        return groups
+    
+    groups = {
+        'version': st.session_state.results_version,
+        'responsive': [],
+        'non_responsive': [],
+        'exemptions': [],
+        'high_conf': [],
+        'medium_conf': [],
+        'low_conf': []
+    }
+    
+    # Each document is bucketed by its least confident determination. Keyed on
+    # enum values: the processors import data_structures as utils.data_structures,
+    # so their ConfidenceLevel members are not the ones imported here
+    confidence_buckets = {
+        ConfidenceLevel.HIGH.value: groups['high_conf'],
+        ConfidenceLevel.MEDIUM.value: groups['medium_conf'],
+        ConfidenceLevel.LOW.value: groups['low_conf']
+    }
+    confidence_rank = {ConfidenceLevel.LOW.value: 0, ConfidenceLevel.MEDIUM.value: 1, ConfidenceLevel.HIGH.value: 2}
+    
+    # Partition in a single pass over both result lists (exemption results
+    # may be shorter, or empty, when a run stopped after phase 1)
+    responsive_append = groups['responsive'].append
+    non_responsive_append = groups['non_responsive'].append
+    exemptions_append = groups['exemptions'].append
+    for i, (result, exemption_result) in enumerate(zip_longest(
+            st.session_state.responsiveness_results, st.session_state.exemption_results)):
+        if result and result.is_responsive_to_any():
+            responsive_append(i)
+        else:
+            non_responsive_append(i)
+        if result and result.confidence:
+            least_confident = min((level.value for level in result.confidence), key=confidence_rank.__getitem__)
+            confidence_buckets[least_confident].append(i)
+        if exemption_result and exemption_result.has_any_exemption():
+            exemptions_append(i)
+    
+    st.session_state.result_groups = groups
+    return groups
+
+
+def get_review_summary() -> Dict:
+    """
+    Get the review summary for the current session, reusing the last one
+    until a review changes.
+    
+    The summary is cached in session state and keyed by review_version,
+    which is bumped whenever a review is saved or the reviews are reset.
+    
+    Returns:
+        Review summary dictionary from ReviewManager.get_review_summary
+    """
+    cached = st.session_state.review_summary
+    if cached is not None and cached[0] == st.session_state.review_version:
+        return cached[1]
+    
+    summary = st.session_state.review_manager.get_review_summary(st.session_state.session)
+    st.session_state.review_summary = (st.session_state.review_version, summary)
+    return summary
+
+
+def get_final_determination_counts() -> Dict[str, int]:
+    """
+    Count responsive, exempt and producible documents from the final
+    determinations, reusing the last counts until a review or result changes.
+    
+    Reviewed documents use the reviewer's decisions; unreviewed ones fall
+    back to the AI results.
+    
+    Returns:
+        Dictionary with 'responsive', 'exempt' and 'producible' counts
+    """
+    version = (st.session_state.review_version, st.session_state.results_version)
+    cached = st.session_state.final_counts
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    # Bind session state once; the loop below runs per document
+    document_reviews = st.session_state.session.document_reviews
+    responsiveness_results = st.session_state.responsiveness_results
+    exemption_results = st.session_state.exemption_results
+    
+    # Count final determinations in a single pass
+    responsive_count = exempt_count = producible_count = 0
+    for i, email_id in enumerate(get_email_fields()['ids']):
+        review = document_reviews.get(email_id)
+        if review:
+            is_responsive = any(review.final_responsive) if review.final_responsive else False
+            is_exempt = bool(review.final_exemptions)
+        else:
+            # Use AI results if no review exists
+            responsiveness = responsiveness_results[i] if i < len(responsiveness_results) else None
+            exemptions = exemption_results[i] if i < len(exemption_results) else None
+            is_responsive = responsiveness.is_responsive_to_any() if responsiveness else False
+            is_exempt = exemptions.has_any_exemption() if exemptions else False
+        
+        responsive_count += is_responsive
+        exempt_count += is_exempt
+        producible_count += is_responsive and not is_exempt
+    
+    counts = {
+        'responsive': responsive_count,
+        'exempt': exempt_count,
+        'producible': producible_count
+    }
+    st.session_state.final_counts = (version, counts)
+    return counts
+
+
+def run_exports(export_manager) -> Optional[Dict[str, str]]:
+    """
+    Generate the export files for the current session, reusing the last
+    export until a review or result changes.
+    
+    Each export button produces the full set of files, so clicking several
+    of them would otherwise regenerate every PDF each time. Rendering runs
+    on the export pool and this call never waits for it: while the job is
+    running it returns None, and export_page reruns to poll again.
+    
+    Args:
+        export_manager: ExportManager used to generate the files
+        
+    Returns:
+        Dictionary of export_type -> file_path, or None while the files
+        are still being generated
+    """
+    version = (st.session_state.review_version, st.session_state.results_version)
+    cached = st.session_state.export_result
+    if cached is not None and cached[0] == version:
+        # Regenerate if any file was removed since the last export
+        if all(Path(path).exists() for path in cached[1].values() if path):
+            return cached[1]
+    
+    # A job started by an earlier run, including one cut short by a rerun,
+    # is picked up again here instead of being resubmitted
+    job = st.session_state.export_job
+    if job is None or job[0] != version:
+        future = get_export_pool().submit(export_manager.generate_exports, st.session_state.session)
+        job = (version, future, time.monotonic())
+        st.session_state.export_job = job
+    future = job[1]
+    if not future.done():
+        return None
+    
+    # Cleared before result() so a failed job is resubmitted on the next request
+    st.session_state.export_job = None
+    result = future.result()
+    st.session_state.export_result = (version, result)
+    return result
+
+
+def poll_exports(export_manager, request: str, error_label: str) -> Optional[Dict[str, str]]:
+    """
+    Return the export files for a button's request once they are ready.
+    
+    A click records the request, so later polling reruns keep showing its
+    status and then its result until the reviews or results change.
+    
+    Args:
+        export_manager: ExportManager used to generate the files
+        request: Export request the calling button records
+        error_label: Message prefix shown if generation fails
+        
+    Returns:
+        Dictionary of export_type -> file_path, or None if the request is
+        not active, still running, or failed
+    """
+    version = (st.session_state.review_version, st.session_state.results_version)
+    if st.session_state.export_request != (request, version):
+        return None
+    
+    try:
+        result = run_exports(export_manager)
+    except Exception as e:
+        st.session_state.export_request = None
+        st.error(f"{error_label}: {str(e)}")
+        return None
+    
+    if result is None:
+        started = st.session_state.export_job[2]
+        st.caption(f"Generating export files... {int(time.monotonic() - started)}s")
+    return result
+
+
+def save_session_file(format: str) -> str:
+    """
+    Save the current session on the session I/O thread.
+    
+    Args:
+        format: Save format passed to SessionManager.save_session
+        
+    Returns:
+        Path to the saved session file
+    """
+    future = get_session_io_pool().submit(
+        get_session_manager().save_session, st.session_state.session, format
+    )
+    with st.spinner("Saving session..."):
+        return future.result()
+
+
+def auto_save_session(session: ProcessingSession, responsiveness_results: List) -> Future:
+    """
+    Save a snapshot of a session on the session I/O thread without waiting.
+    
+    The containers the processing loop keeps filling are copied first, so
+    the background write sees a consistent session while the loop carries on.
+    
+    Args:
+        session: ProcessingSession being processed
+        responsiveness_results: Responsiveness results so far, indexed like the emails
+        
+    Returns:
+        Future for the save, resolving to the saved file path
+    """
+    responsiveness_snapshot = dict(session.responsiveness_results)
+    responsiveness_snapshot.update(
+        {str(j): result for j, result in enumerate(responsiveness_results) if result}
+    )
+    snapshot = dataclasses.replace(
+        session,
+        cpra_requests=list(session.cpra_requests),
+        emails=list(session.emails),
+        responsiveness_results=responsiveness_snapshot,
+        exemption_results=dict(session.exemption_results),
+        document_reviews=dict(session.document_reviews),
+        stats=dataclasses.replace(session.stats)
+    )
+    
+    def log_failure(future: Future):
+        if future.exception() is not None:
+            logger.warning(f"Auto-save failed: {future.exception()}")
+    
+    future = get_session_io_pool().submit(get_session_manager().save_session, snapshot)
+    future.add_done_callback(log_failure)
+    return future
 
 
 def sidebar_navigation():
@@ -189,11 +688,11 @@ def sidebar_navigation():
         st.sidebar.text(f"Requests: {len(st.session_state.cpra_requests)}")
         
         if st.session_state.processing_complete:
-            responsive_count = sum(1 for r in st.session_state.responsiveness_results if r and r.is_responsive_to_any())
+            responsive_count = len(get_result_groups()['responsive'])
             st.sidebar.text(f"Responsive: {responsive_count}")
             
             if st.session_state.review_manager:
-                summary = st.session_state.review_manager.get_review_summary(st.session_state.session)
+                summary = get_review_summary()
                 completed = summary['review_status']['completed']
                 total = summary['total_documents']
                 st.sidebar.text(f"Reviewed: {completed}/{total}")
@@ -206,7 +705,7 @@ def sidebar_navigation():
     # Resource monitor in sidebar if demo mode
     if st.session_state.demo_mode and demo_settings.get('resource_monitor', False):
         st.sidebar.markdown("---")
-        st.session_state.resource_monitor.create_compact_monitor(st.sidebar)
+        get_resource_monitor().create_compact_monitor(st.sidebar)
 
 
 def upload_page():
@@ -254,9 +753,11 @@ def upload_page():
                 st.error("Demo data not found. Please ensure demo-files directory exists.")
         
         if uploaded_file is not None:
-            content = uploaded_file.read().decode('utf-8')
-            # Only parse if content looks like emails (has From: header)
-            if content and 'From:' in content:
+            # getvalue() returns the upload buffer without a stream copy
+            raw = uploaded_file.getvalue()
+            # Only decode and parse if content looks like emails (has From: header)
+            if raw and b'From:' in raw:
+                content = raw.decode('utf-8', errors='replace')
                 emails = parse_emails(content)
                 st.session_state.emails = emails
                 st.success(f"Parsed {len(emails)} emails from uploaded file")
@@ -275,32 +776,33 @@ def upload_page():
         st.markdown("### CPRA Requests")
         st.info("Enter up to 5 CPRA requests that describe the documents you're looking for")
         
-        # CPRA request inputs
-        requests = []
-        # Pre-fill with demo requests if available
+        # Pre-fill with demo requests if available (CPRARequest objects or strings)
         existing_requests = st.session_state.cpra_requests if st.session_state.cpra_requests else []
+        defaults = [
+            req.text if isinstance(req, CPRARequest) else str(req)
+            for req in existing_requests[:5]
+        ]
+        defaults += [""] * (5 - len(defaults))
         
-        for i in range(5):
-            if i < len(existing_requests):
-                # Handle both CPRARequest objects and strings
-                default_value = existing_requests[i].text if isinstance(existing_requests[i], CPRARequest) else str(existing_requests[i])
-            else:
-                default_value = ""
-            request = st.text_area(
+        # CPRA request inputs
+        entries = [
+            st.text_area(
                 f"Request {i+1}",
                 key=f"cpra_request_{i}",
                 height=80,
                 value=default_value,
                 placeholder="e.g., All documents regarding roof leak issues on the Community Center construction project"
             )
-            if request.strip():
-                requests.append(request.strip())
-        
-        # Convert string requests to CPRARequest objects
-        st.session_state.cpra_requests = [
-            CPRARequest(text=req, request_id=f"request_{i}")
-            for i, req in enumerate(requests)
+            for i, default_value in enumerate(defaults)
         ]
+        requests = [entry.strip() for entry in entries if entry.strip()]
+        
+        # Only rebuild the CPRARequest objects when the entered text changes
+        if requests != [req.text for req in existing_requests if isinstance(req, CPRARequest)]:
+            st.session_state.cpra_requests = [
+                CPRARequest(text=req, request_id=f"request_{i}")
+                for i, req in enumerate(requests)
+            ]
         
         if requests:
             st.success(f"{len(requests)} CPRA request(s) configured")
@@ -320,12 +822,76 @@ def upload_page():
                     emails=st.session_state.emails
                 )
                 st.session_state.session = session
+                # Fresh result lists; processing_page resumes into these if interrupted
+                st.session_state.responsiveness_results = []
+                st.session_state.exemption_results = []
+                st.session_state.results_version += 1
+                st.session_state.review_version += 1
                 st.session_state.page = 'processing'
                 st.rerun()
         else:
             st.warning("Please upload emails and enter at least one CPRA request")
 
 
+def analysis_memo_key(kind: str, model_name: str, email: Email, request_texts: Tuple[str, ...] = ()) -> Tuple:
+    """
+    Build the memo key for one analysis call.
+    
+    The key covers everything the model sees, so identical emails (the same
+    message exported from several mailboxes) share one analysis.
+    
+    Args:
+        kind: Analysis type ('responsiveness' or 'exemptions')
+        model_name: Model performing the analysis
+        email: Email being analyzed
+        request_texts: CPRA request texts included in the prompt
+        
+    Returns:
+        Hashable memo key
+    """
+    digest = hashlib.blake2b(email.get_display_text().encode('utf-8'), digest_size=16).hexdigest()
+    return (kind, model_name, request_texts, digest)
+
+
+def remember_analysis(memo: Dict[Tuple, Any], key: Tuple, result: Any):
+    """Store an analysis result, dropping the oldest entry once the memo is full."""
+    if key not in memo and len(memo) >= ANALYSIS_MEMO_LIMIT:
+        del memo[next(iter(memo))]
+    memo[key] = result
+
+
+def reuse_analysis(result: Any, email_id: str) -> Any:
+    """Return a memoized analysis relabelled for the email it is reused for."""
+    if result.email_id == email_id:
+        return result
+    return dataclasses.replace(result, email_id=email_id)
+
+
+def _json_instructions_excerpt(content: str) -> Optional[str]:
+    """
+    Cut the structured-output instructions out of a system prompt.
+    
+    Args:
+        content: Full system prompt text
+        
+    Returns:
+        Up to 1000 characters around the JSON format instructions, or None
+        if the prompt does not contain them after its first character
+    """
+    json_start = content.find('You must respond with valid JSON')
+    if json_start <= 0:
+        return None
+    
+    # Show context before and the full JSON instructions
+    display_start = max(0, json_start - 200)
+    excerpt = content[display_start:json_start + 800]
+    if display_start > 0:
+        excerpt = "..." + excerpt
+    if json_start + 800 < len(content):
+        excerpt = excerpt + "..."
+    return excerpt
+
+
 def processing_page():
     """Processing page with real-time progress indicators."""
     st.title("Processing Documents")
@@ -354,11 +920,8 @@ def processing_page():
             st.markdown("### 🤖 AI Processing Stream")
             st.info("This view shows the prompts sent to the AI and responses received during processing.")
             
-            # Get stream events directly from session state
-            # This ensures we always get the current state
-            events_list = []
-            if 'stream_events' in st.session_state:
-                events_list = st.session_state.stream_events
+            # Seeded by init_session_state, so no existence check is needed
+            events_list = st.session_state.stream_events
             
             # Show event count and refresh button
             col1, col2 = st.columns([3, 1])
@@ -382,26 +945,15 @@ def processing_page():
                 
                 # Show last few events as simple list first
                 st.markdown("#### Recent Events (Simple View)")
-                for event in events_list[-5:]:
-                    content = event.get('content', '')
-                    content_len = len(content) if content else 0
-                    st.text(f"{event['type']}: {content_len} chars")
+                recent_events = list(islice(reversed(events_list), 5))
+                for event in reversed(recent_events):
+                    st.text(f"{event['type']}: {event['content_length']} chars")
                 
-                # Find the most recent complete prompt/response pair
-                last_system_prompt = None
-                last_user_prompt = None
-                last_response = None
-                
-                for event in reversed(events_list):
-                    if event['type'] == 'response_complete' and not last_response:
-                        last_response = event
-                    elif event['type'] == 'user_prompt' and not last_user_prompt:
-                        last_user_prompt = event
-                    elif event['type'] == 'system_prompt' and not last_system_prompt:
-                        last_system_prompt = event
-                    
-                    if last_system_prompt and last_user_prompt and last_response:
-                        break
+                # Most recent event of each type, kept up to date by the stream callback
+                last_events = st.session_state.last_stream_events
+                last_system_prompt = last_events.get('system_prompt')
+                last_user_prompt = last_events.get('user_prompt')
+                last_response = last_events.get('response_complete')
                 
                 # Display the last complete interaction
                 if last_system_prompt or last_user_prompt or last_response:
@@ -417,27 +969,15 @@ def processing_page():
                                 # Show more of the system prompt, especially the structured output part
                                 content = last_system_prompt['content']
                                 
-                                # Try to show at least the structured output instructions
-                                if 'You must respond with valid JSON' in content:
-                                    # Find and highlight the JSON format section
-                                    json_start = content.find('You must respond with valid JSON')
-                                    if json_start > 0:
-                                        # Show context before and the full JSON instructions
-                                        display_start = max(0, json_start - 200)
-                                        display_content = content[display_start:min(len(content), json_start + 800)]
-                                        if display_start > 0:
-                                            display_content = "..." + display_content
-                                        if json_start + 800 < len(content):
-                                            display_content = display_content + "..."
-                                        st.code(display_content, language="text")
-                                        
-                                        # Add button to see full prompt
-                                        if len(content) > 1000:
-                                            with st.expander("View Complete System Prompt"):
-                                                st.code(content, language="text")
-                                    else:
-                                        # Fallback to showing first 1500 chars
-                                        st.code(content[:1500] + '...' if len(content) > 1500 else content, language="text")
+                                # Structured output instructions, cut out once by the stream callback
+                                excerpt = last_system_prompt.get('excerpt')
+                                if excerpt is not None:
+                                    st.code(excerpt, language="text")
+                                    
+                                    # Add button to see full prompt
+                                    if len(content) > 1000:
+                                        with st.expander("View Complete System Prompt"):
+                                            st.code(content, language="text")
                                 else:
                                     # Show first 1500 characters
                                     st.code(content[:1500] + '...' if len(content) > 1500 else content, language="text")
@@ -460,18 +1000,16 @@ def processing_page():
                     with col2:
                         st.markdown("#### 📥 AI Response")
                         if last_response:
-                            try:
-                                response_json = json.loads(last_response['content'])
-                                st.json(response_json)
-                            except:
+                            if last_response.get('parsed') is not None:
+                                st.json(last_response['parsed'])
+                            else:
                                 st.code(last_response['content'][:500] + '...' if len(last_response['content']) > 500 else last_response['content'])
                 
-                # Show full event log
-                with st.expander("Full Event Log"):
+                # Full event log: expander bodies run even when collapsed, so
+                # the per-event loop is behind an explicit opt-in
+                if st.checkbox("Show full event log", value=False, key="show_full_event_log"):
                     for i, event in enumerate(events_list):
-                        content = event.get('content', '')
-                        content_len = len(content) if content else 0
-                        st.text(f"{i+1}. {event['type']} - {content_len} chars - {event.get('timestamp', 'no time')}")
+                        st.text(f"{i+1}. {event['type']} - {event['content_length']} chars - {event.get('timestamp', 'no time')}")
             else:
                 st.warning("No AI processing data yet. Start processing emails to see the AI prompts and responses.")
                 st.info("Make sure Demo Mode is enabled BEFORE starting processing.")
@@ -485,7 +1023,7 @@ def processing_page():
                 st.info("Navigate to Results Dashboard or Document Review to view results.")
                 
                 # Debug: Show if we have stream events
-                events_count = len(st.session_state.get('stream_events', []))
+                events_count = len(st.session_state.stream_events)
                 st.info(f"Debug: {events_count} stream events captured")
                 if events_count > 0:
                     st.success("✅ Stream events are available in the AI Stream View tab above!")
@@ -547,10 +1085,13 @@ def processing_page():
     if demo_mode and show_resources:
         with resource_container:
             st.markdown("### System Resources")
-            st.session_state.resource_monitor.create_resource_dashboard(
+            get_resource_monitor().create_resource_dashboard(
                 resource_container, 
                 model_name="gemma3:latest"
             )
+        # Refreshed in place during processing instead of stacking new panels
+        processing_monitor_slot = resource_container.empty()
+        last_monitor_update = 0.0
     
     with progress_container:
         st.markdown("### Processing Progress")
@@ -588,12 +1129,62 @@ def processing_page():
     with log_container:
         st.markdown("### Processing Log")
         log_area = st.empty()
-        logs = []
+        logs = deque(maxlen=10)  # Only the last 10 lines are ever displayed
+        last_log_render = 0.0
+        last_log_text = None
+    
+    def render_logs(force: bool = False):
+        """Redraw the log panel when it changed, at most every 0.25s unless forced."""
+        nonlocal last_log_render, last_log_text
+        now = time.monotonic()
+        if force or now - last_log_render >= 0.25:
+            log_text = "\n".join(logs)
+            if force or log_text != last_log_text:
+                # Static code block is lighter than an editable text_area
+                log_area.code(log_text, language="text")
+                last_log_text = log_text
+            last_log_render = now
+    
+    metric_widgets = {
+        "Documents Processed": docs_processed,
+        "Responsive": responsive_count,
+        "With Exemptions": exemption_count,
+        "Processing Time": processing_time
+    }
+    shown_metrics = {}
+    last_metric_update = 0.0
+    
+    def update_metrics(values: Dict[str, str], force: bool = False):
+        """Push changed metric values, at most twice a second unless forced."""
+        nonlocal last_metric_update
+        now = time.monotonic()
+        if not force and now - last_metric_update < 0.5:
+            return
+        last_metric_update = now
+        values["Processing Time"] = f"{int(time.time() - start_time)}s"
+        for label, value in values.items():
+            if shown_metrics.get(label) != value:
+                metric_widgets[label].metric(label, value)
+                shown_metrics[label] = value
+    
+    shown_percent = 0
+    last_progress_update = 0.0
+    
+    def update_progress(fraction: float, force: bool = False):
+        """Push the progress bar when its whole percent changes, at most every 0.1s unless forced."""
+        nonlocal shown_percent, last_progress_update
+        percent = min(100, int(fraction * 100))
+        now = time.monotonic()
+        if percent == shown_percent or (not force and now - last_progress_update < 0.1):
+            return
+        overall_progress.progress(percent)
+        shown_percent = percent
+        last_progress_update = now
     
     # Start processing with error handling
     start_time = time.time()
     try:
-        analyzer = CPRAAnalyzer(model_name=config.model.responsiveness_model)
+        analyzer = get_analyzer(config.model.responsiveness_model)
     except Exception as e:
         st.error(f"Failed to initialize analyzer: {str(e)}")
         logger.error(f"Analyzer initialization failed: {e}")
@@ -609,39 +1200,65 @@ def processing_page():
         phase_3_indicator.info("Finalizing Results")
         
     phase_text.markdown("**Current Phase:** Analyzing Responsiveness")
-    logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Starting responsiveness analysis...")
-    log_area.text_area("Processing Log", "\n".join(logs), height=200)
+    logs.append(f"[{time.strftime('%H:%M:%S')}] Starting responsiveness analysis...")
+    render_logs(force=True)
     
     # Prepare streaming callback if in demo mode (defined once for the whole loop)
     stream_cb = None
     if demo_mode:
-        # Initialize stream events list if needed
-        if 'stream_events' not in st.session_state:
-            st.session_state.stream_events = []
-            
+        # Bound here so the callback needs no script context, and appended
+        # under a lock so it is safe when analysis calls run on worker threads
+        stream_events = st.session_state.stream_events
+        last_events = st.session_state.last_stream_events
+        stream_lock = threading.Lock()
+        
         # Debug: log current state
-        logger.info(f"Demo mode active, current stream_events count: {len(st.session_state.stream_events)}")
+        logger.info(f"Demo mode active, current stream_events count: {len(stream_events)}")
         
         # Create callback function that stores events
         def stream_cb(event_type, content, metadata):
-            # Ensure stream_events exists
-            if 'stream_events' not in st.session_state:
-                st.session_state.stream_events = []
-                
             # Store events for display after processing
+            content_length = len(content) if content else 0
             event = {
                 'type': event_type,
                 'content': content,
+                'content_length': content_length,
                 'metadata': metadata if metadata else {},
                 'timestamp': datetime.now()
             }
-            st.session_state.stream_events.append(event)
+            # Parse the response and cut the prompt excerpt once here rather
+            # than on every rerun of the stream view
+            if event_type == 'system_prompt' and content:
+                event['excerpt'] = _json_instructions_excerpt(content)
+            if event_type == 'response_complete' and content:
+                try:
+                    event['parsed'] = orjson.loads(content) if orjson is not None else json.loads(content)
+                except ValueError:  # orjson.JSONDecodeError and json.JSONDecodeError both subclass it
+                    event['parsed'] = None
+            
+            # The log only shows lengths, so it keeps a truncated copy
+            logged_event = dict(event, content=content[:STREAM_EVENT_CONTENT_LIMIT] if content else content)
+            with stream_lock:
+                stream_events.append(logged_event)
+                if event_type in LAST_INTERACTION_EVENT_TYPES:
+                    last_events[event_type] = event
+                total_events = len(stream_events)
             
             # Debug logging
-            logger.info(f"Stream event captured: {event_type}, content_length: {len(content) if content else 0}, total_events: {len(st.session_state.stream_events)}")
+            logger.info(f"Stream event captured: {event_type}, content_length: {content_length}, total_events: {total_events}")
+    
+    # Demo mode renders per-email progress, so it always runs sequentially
+    if config.processing.enable_parallel_processing and not demo_mode:
+        max_workers = max(1, config.processing.max_concurrent_requests)
+    else:
+        max_workers = 1
     
-    responsiveness_results = []
-    for i, email in enumerate(st.session_state.emails):
+    # Worker threads have no Streamlit script context, so read session state here
+    emails = st.session_state.emails
+    cpra_requests = st.session_state.cpra_requests
+    
+    def analyze_responsiveness(i):
+        email = emails[i]
         if demo_mode:
             # Show current document details
             current_doc_display.info(f"""
@@ -656,141 +1273,260 @@ def processing_page():
             
             # Show AI activity
             ai_activity.warning(get_ai_thinking_animation("responsiveness"))
-            
-            # Add processing delay for visual effect
-            simulate_processing_delay(demo_mode, base_delay=1.0, speed_multiplier=speed)
         
-        # Analyze responsiveness with error handling
-        try:
-            # Debug: log if callback is being passed
-            logger.info(f"Analyzing email {i+1}, stream_cb is {'set' if stream_cb else 'None'}")
+        # Debug: log if callback is being passed
+        logger.info(f"Analyzing email {i+1}, stream_cb is {'set' if stream_cb else 'None'}")
+        
+        started = time.monotonic()
+        result = analyzer.analyze_email_responsiveness(
+            email, 
+            cpra_requests,
+            email_index=i,
+            stream_callback=stream_cb
+        )
+        
+        # Keep the document on screen for a minimum time; a slow model call counts toward it
+        if demo_mode:
+            simulate_processing_delay(demo_mode, base_delay=1.0, speed_multiplier=speed,
+                                      elapsed=time.monotonic() - started)
+        return result
+    
+    def analyze_responsiveness_group(group):
+        # Email IDs are derived from start_index, so gaps left by a resumed run go one by one
+        if group[-1] - group[0] + 1 != len(group):
+            return [analyzer.analyze_email_responsiveness(emails[i], cpra_requests, i) for i in group]
+        return analyzer.analyze_emails_responsiveness_batch(
+            [emails[i] for i in group],
+            cpra_requests,
+            start_index=group[0]
+        )
+    
+    exemption_stream_cb = stream_cb if demo_mode and st.session_state.stream_callback else None
+    
+    def analyze_exemptions(i):
+        email = emails[i]
+        if demo_mode:
+            current_doc_display.warning(f"""
+            **Checking Email {i+1} for Exemptions**
             
-            result = analyzer.analyze_email_responsiveness(
-                email, 
-                st.session_state.cpra_requests,
-                email_index=i,
-                stream_callback=stream_cb
-            )
-            responsiveness_results.append(result)
-        except Exception as e:
-            logger.error(f"Error analyzing email {i+1}: {e}")
-            errors_encountered.append(f"Email {i+1}: {str(e)}")
-            # Create failed result
-            responsiveness_results.append(None)
-            logs.append(f"[{datetime.now().strftime('%H:%M:%S')}]  Error processing email {i+1}")
+            **Subject:** {email.subject or '(No subject)'}
+            
+            **Status:** Responsive Document
+            
+            **Scanning for:** Attorney-Client, Personnel Records, Deliberative Process
+            """)
+            
+            ai_activity.warning(get_ai_thinking_animation("exemptions"))
         
-        # Auto-save session periodically
-        if (i + 1) % config.processing.auto_save_interval == 0:
-            pass  # Recovery functionality removed
+        started = time.monotonic()
+        result = analyzer.analyze_email_exemptions(
+            email,
+            email_index=i,
+            stream_callback=exemption_stream_cb
+        )
         
-        # Clear AI activity after processing
+        # Keep the document on screen for a minimum time; a slow model call counts toward it
         if demo_mode:
-            ai_activity.success(f" Analysis complete: {'Responsive' if result and result.is_responsive_to_any() else 'Not Responsive'}")
-            simulate_processing_delay(demo_mode, base_delay=0.3, speed_multiplier=speed)
+            simulate_processing_delay(demo_mode, base_delay=0.8, speed_multiplier=speed,
+                                      elapsed=time.monotonic() - started)
+        return result
+    
+    exemption_results = st.session_state.exemption_results
+    if len(exemption_results) != total_emails:
+        exemption_results = [None] * total_emails
+        st.session_state.exemption_results = exemption_results
+    
+    # Optionally start each responsive email's exemption check as soon as its
+    # responsiveness result arrives, so the two phases overlap. Demo mode
+    # shows the phases one after the other, so it never pipelines.
+    exemption_executor = None
+    exemption_futures = {}
+    exemption_keys = {}
+    if config.processing.enable_phase_pipelining and not demo_mode:
+        exemption_executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Both phases draw on one budget, so Ollama still sees at most
+        # max_workers calls at once
+        call_budget = threading.BoundedSemaphore(max_workers)
+        analyze_responsiveness = within_budget(analyze_responsiveness, call_budget)
+        analyze_responsiveness_group = within_budget(analyze_responsiveness_group, call_budget)
+        analyze_exemptions = within_budget(analyze_exemptions, call_budget)
+    
+    try:
+        # Results are written straight into session state, so a rerun that
+        # interrupts the loop resumes with the emails that are still missing
+        responsiveness_results = st.session_state.responsiveness_results
+        if len(responsiveness_results) != total_emails:
+            responsiveness_results = [None] * total_emails
+            st.session_state.responsiveness_results = responsiveness_results
+        pending = [i for i, r in enumerate(responsiveness_results) if r is None]
+        if len(pending) < total_emails:
+            logs.append(f"[{time.strftime('%H:%M:%S')}] Resuming: {total_emails - len(pending)} email(s) already analyzed")
         
-        # Update progress with smooth animation in demo mode
-        progress = (i + 1) / (total_emails * 2)  # Two phases
-        if demo_mode and show_animations:
-            # Animate progress bar smoothly
-            current_progress = overall_progress.progress(0)
-            for step in range(int(progress * 100)):
-                overall_progress.progress(step / 100.0)
-                time.sleep(0.001 / speed)
-        else:
-            overall_progress.progress(progress)
+        # Identical emails analyzed earlier in this session reuse their result
+        analysis_memo = st.session_state.analysis_memo
+        email_ids = get_email_fields()['ids']
+        request_texts = tuple(req.text for req in cpra_requests)
+        responsiveness_keys = {
+            i: analysis_memo_key('responsiveness', analyzer.model_name, emails[i], request_texts)
+            for i in pending
+        }
+        for i in pending:
+            memoized = analysis_memo.get(responsiveness_keys[i])
+            if memoized is not None:
+                responsiveness_results[i] = reuse_analysis(memoized, email_ids[i])
+        reused = len(pending)
+        pending = [i for i in pending if responsiveness_results[i] is None]
+        reused -= len(pending)
+        if reused:
+            logs.append(f"[{time.strftime('%H:%M:%S')}] Reusing {reused} earlier analysis result(s)")
         
-        # Update stats
-        docs_processed.metric("Documents Processed", f"{i+1}/{total_emails}")
+        # Running count, so metrics never rescan the results
         responsive_so_far = sum(1 for r in responsiveness_results if r and r.is_responsive_to_any())
-        responsive_count.metric("Responsive", str(responsive_so_far))
-        elapsed = int(time.time() - start_time)
-        processing_time.metric("Processing Time", f"{elapsed}s")
-        
-        # Update resource monitor
-        if demo_mode and show_resources and i % 3 == 0:  # Update every 3 emails
-            with resource_container:
-                st.session_state.resource_monitor.create_processing_monitor(
-                    resource_container,
+        if config.processing.enable_prompt_batching and not demo_mode:
+            # Several emails share one prompt so the requests are only sent once per group
+            analysis_stream = iter_batched_analysis_results(
+                analyze_responsiveness_group, pending, config.processing.batch_size, max_workers
+            )
+        else:
+            analysis_stream = iter_analysis_results(analyze_responsiveness, pending, max_workers)
+        # 0 disables auto-save; resolved once so the loop does no config lookups
+        auto_save_interval = config.processing.auto_save_interval if config.session.enable_auto_save else 0
+        auto_save = None
+        for done, (i, result, error) in enumerate(analysis_stream, start=total_emails - len(pending) + 1):
+            ts = time.strftime('%H:%M:%S')
+            
+            # Record result or error
+            is_responsive = error is None and bool(result and result.is_responsive_to_any())
+            if error is None:
+                responsiveness_results[i] = result
+                if result is not None:
+                    remember_analysis(analysis_memo, responsiveness_keys[i], result)
+                if is_responsive:
+                    responsive_so_far += 1
+                    if exemption_executor is not None and exemption_results[i] is None:
+                        exemption_keys[i] = analysis_memo_key('exemptions', analyzer.model_name, emails[i])
+                        if exemption_keys[i] not in analysis_memo:
+                            exemption_futures[exemption_executor.submit(analyze_exemptions, i)] = i
+            else:
+                logger.error(f"Error analyzing email {i+1}: {error}")
+                errors_encountered.append(f"Email {i+1}: {str(error)}")
+                logs.append(f"[{ts}]  Error processing email {i+1}")
+            
+            # Auto-save session periodically on the session I/O thread; skipped
+            # while the previous save is still being written
+            if auto_save_interval and done % auto_save_interval == 0 and (auto_save is None or auto_save.done()):
+                try:
+                    auto_save = auto_save_session(st.session_state.session, responsiveness_results)
+                except Exception as e:
+                    logger.warning(f"Auto-save failed after {done} emails: {e}")
+            
+            # Clear AI activity after processing
+            if demo_mode:
+                ai_activity.success(f" Analysis complete: {'Responsive' if is_responsive else 'Not Responsive'}")
+                simulate_processing_delay(demo_mode, base_delay=0.3, speed_multiplier=speed)
+            
+            # Update progress (throttled; the bar's own transition animates it)
+            update_progress(done / (total_emails * 2), force=done == total_emails)  # Two phases
+            
+            # Update stats
+            update_metrics({
+                "Documents Processed": f"{done}/{total_emails}",
+                "Responsive": str(responsive_so_far)
+            }, force=done == total_emails)
+            
+            # Update resource monitor, at most once a second
+            if demo_mode and show_resources and time.monotonic() - last_monitor_update >= 1.0:
+                get_resource_monitor().create_processing_monitor(
+                    processing_monitor_slot.container(),
                     phase="responsiveness",
                     model_active=True
                 )
+                last_monitor_update = time.monotonic()
+            
+            logs.append(f"[{ts}] Email {i+1}: {'Responsive' if is_responsive else 'Not Responsive'}")
+            if demo_mode and demo_settings.get('typewriter', False):
+                typewriter_effect(logs[-1], log_area, demo_mode, speed=0.01)
+            else:
+                render_logs()
         
-        logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Email {i+1}: {'Responsive' if result and result.is_responsive_to_any() else 'Not Responsive'}")
-        if demo_mode and demo_settings.get('typewriter', False):
-            typewriter_effect(logs[-1], log_area, demo_mode, speed=0.01)
-        else:
-            log_area.text_area("Processing Log", "\n".join(logs[-10:]), height=200)
-    
-    st.session_state.responsiveness_results = responsiveness_results
-    
-    # Phase 2: Exemption Analysis
-    if demo_mode:
-        phase_1_indicator.success("  Responsiveness Complete")
-        phase_2_indicator.success("▶  Checking Exemptions")
+        st.session_state.responsiveness_results = responsiveness_results
         
-    phase_text.markdown("**Current Phase:**  Checking Exemptions")
-    logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Starting exemption analysis...")
-    log_area.text_area("Processing Log", "\n".join(logs[-10:]), height=200)
-    
-    exemption_results = []
-    for i, email in enumerate(st.session_state.emails):
-        # Only analyze exemptions for responsive emails
-        if responsiveness_results[i] and responsiveness_results[i].is_responsive_to_any():
-            if demo_mode:
-                current_doc_display.warning(f"""
-                **Checking Email {i+1} for Exemptions**
-                
-                **Subject:** {email.subject or '(No subject)'}
-                
-                **Status:** Responsive Document
-                
-                **Scanning for:** Attorney-Client, Personnel Records, Deliberative Process
-                """)
-                
-                ai_activity.warning(get_ai_thinking_animation("exemptions"))
-                simulate_processing_delay(demo_mode, base_delay=0.8, speed_multiplier=speed)
+        # Phase 2: Exemption Analysis
+        if demo_mode:
+            phase_1_indicator.success("  Responsiveness Complete")
+            phase_2_indicator.success("▶  Checking Exemptions")
             
-            try:
-                result = analyzer.analyze_email_exemptions(
-                    email,
-                    email_index=i,
-                    stream_callback=stream_cb if demo_mode and st.session_state.stream_callback else None
-                )
-                exemption_results.append(result)
-            except Exception as e:
-                logger.error(f"Error analyzing exemptions for email {i+1}: {e}")
-                errors_encountered.append(f"Exemption analysis for email {i+1}: {str(e)}")
-                exemption_results.append(None)
-                logs.append(f"[{datetime.now().strftime('%H:%M:%S')}]  Error checking exemptions for email {i+1}")
+        phase_text.markdown("**Current Phase:**  Checking Exemptions")
+        logs.append(f"[{time.strftime('%H:%M:%S')}] Starting exemption analysis...")
+        render_logs(force=True)
+        
+        # Only responsive emails need exemption analysis
+        responsive_indices = [
+            i for i, r in enumerate(responsiveness_results)
+            if r and r.is_responsive_to_any()
+        ]
+        
+        pending = [i for i in responsive_indices if exemption_results[i] is None]
+        for i in pending:
+            if i not in exemption_keys:
+                exemption_keys[i] = analysis_memo_key('exemptions', analyzer.model_name, emails[i])
+            memoized = analysis_memo.get(exemption_keys[i])
+            if memoized is not None:
+                exemption_results[i] = reuse_analysis(memoized, email_ids[i])
+        pending = [i for i in pending if exemption_results[i] is None]
+        
+        exemptions_so_far = sum(1 for r in exemption_results if r and r.has_any_exemption())
+        total_responsive = len(responsive_indices)
+        if exemption_executor is not None:
+            # Responsive results kept from an interrupted run were never submitted
+            prefetched = set(exemption_futures.values())
+            for i in pending:
+                if i not in prefetched:
+                    exemption_futures[exemption_executor.submit(analyze_exemptions, i)] = i
+            analysis_stream = iter_completed(exemption_futures)
+        else:
+            analysis_stream = iter_analysis_results(analyze_exemptions, pending, max_workers)
+        for done, (i, result, error) in enumerate(analysis_stream, start=total_responsive - len(pending) + 1):
+            ts = time.strftime('%H:%M:%S')
+            
+            has_exemption = error is None and bool(result and result.has_any_exemption())
+            if error is None:
+                exemption_results[i] = result
+                if result is not None:
+                    remember_analysis(analysis_memo, exemption_keys[i], result)
+                if has_exemption:
+                    exemptions_so_far += 1
+            else:
+                logger.error(f"Error analyzing exemptions for email {i+1}: {error}")
+                errors_encountered.append(f"Exemption analysis for email {i+1}: {str(error)}")
+                logs.append(f"[{ts}]  Error checking exemptions for email {i+1}")
             
             if demo_mode:
-                if result and result.has_any_exemption():
+                if has_exemption:
                     num_exemptions = len(result.get_applicable_exemptions())
                     ai_activity.warning(f" Found {num_exemptions} exemption(s)")
                 else:
                     ai_activity.success(" No exemptions found")
                 simulate_processing_delay(demo_mode, base_delay=0.2, speed_multiplier=speed)
-        else:
-            exemption_results.append(None)
-            if demo_mode:
-                current_doc_display.info(f" Skipping non-responsive email {i+1}")
-                simulate_processing_delay(demo_mode, base_delay=0.1, speed_multiplier=speed)
-        
-        # Update progress
-        progress = (total_emails + i + 1) / (total_emails * 2)
-        overall_progress.progress(progress)
-        
-        # Update stats
-        exemptions_so_far = sum(1 for r in exemption_results if r and r.has_any_exemption())
-        exemption_count.metric("With Exemptions", str(exemptions_so_far))
-        elapsed = int(time.time() - start_time)
-        processing_time.metric("Processing Time", f"{elapsed}s")
+            
+            # Update progress
+            update_progress(
+                (total_emails + (done / total_responsive) * total_emails) / (total_emails * 2),
+                force=done == total_responsive
+            )
+            
+            # Update stats
+            update_metrics({"With Exemptions": str(exemptions_so_far)}, force=done == total_responsive)
+            
+            if exemption_results[i]:
+                logs.append(f"[{ts}] Email {i+1}: {len(exemption_results[i].get_applicable_exemptions())} exemption(s) found")
+                render_logs()
         
-        if exemption_results[i]:
-            logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Email {i+1}: {len(exemption_results[i].get_applicable_exemptions())} exemption(s) found")
-            log_area.text_area("Processing Log", "\n".join(logs[-10:]), height=200)
-    
-    st.session_state.exemption_results = exemption_results
+        st.session_state.exemption_results = exemption_results
+    finally:
+        # Cancel queued exemption checks if the run is interrupted
+        if exemption_executor is not None:
+            exemption_executor.shutdown(wait=False, cancel_futures=True)
     
     # Phase 3: Finalize
     if demo_mode:
@@ -808,18 +1544,21 @@ def processing_page():
     try:
         # First update the session with the analysis results
         # Convert lists to dicts indexed by email index
-        for i, result in enumerate(responsiveness_results):
-            if result:
-                st.session_state.session.responsiveness_results[str(i)] = result
-        
-        for i, result in enumerate(exemption_results):
-            if result:
-                st.session_state.session.exemption_results[str(i)] = result
+        session = st.session_state.session
+        session.responsiveness_results.update(
+            {str(i): result for i, result in enumerate(responsiveness_results) if result}
+        )
+        session.exemption_results.update(
+            {str(i): result for i, result in enumerate(exemption_results) if result}
+        )
         
+        from src.processors.review_manager import ReviewManager
         review_manager = ReviewManager()
         review_manager.initialize_reviews(st.session_state.session)
         st.session_state.review_manager = review_manager
         st.session_state.processing_complete = True
+        st.session_state.results_version += 1
+        st.session_state.review_version += 1
         
         
     except Exception as e:
@@ -846,23 +1585,23 @@ def processing_page():
         
         # Final resource display
         if show_resources:
-            with resource_container:
-                st.session_state.resource_monitor.create_processing_monitor(
-                    resource_container,
-                    phase="finalize",
-                    model_active=False
-                )
+            get_resource_monitor().create_processing_monitor(
+                processing_monitor_slot.container(),
+                phase="finalize",
+                model_active=False
+            )
     
-    logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Processing complete!")
-    logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Total time: {total_time}s")
-    logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] Average: {total_time/total_emails:.1f}s per email")
-    log_area.text_area("Processing Log", "\n".join(logs[-10:]), height=200)
+    ts = time.strftime('%H:%M:%S')
+    logs.append(f"[{ts}] Processing complete!")
+    logs.append(f"[{ts}] Total time: {total_time}s")
+    logs.append(f"[{ts}] Average: {total_time/total_emails:.1f}s per email")
+    render_logs(force=True)
     
     # Enhanced success message for demo mode
     if demo_mode:
         # Create impressive summary statistics
-        responsive_docs = sum(1 for r in responsiveness_results if r and r.is_responsive_to_any())
-        exempt_docs = sum(1 for r in exemption_results if r and r.has_any_exemption())
+        responsive_docs = responsive_so_far
+        exempt_docs = exemptions_so_far
         
         st.balloons()  # Celebration effect
         
@@ -880,7 +1619,7 @@ def processing_page():
             ###  Performance Highlights:
             -  All processing completed locally (no cloud services used)
             -  Data never left this device (airplane mode compatible)
-            -  Average processing speed: {total_emails/(total_time/60):.1f} emails/minute
+            -  Average processing speed: {total_emails * 60 / max(total_time, 1):.1f} emails/minute
             """)
         
         with col2:
@@ -903,8 +1642,8 @@ def processing_page():
         st.success(f"""
          **Processing Complete!**
         - Processed {total_emails} emails in {total_time} seconds
-        - Found {sum(1 for r in responsiveness_results if r and r.is_responsive_to_any())} responsive documents
-        - Identified {sum(1 for r in exemption_results if r and r.has_any_exemption())} documents with exemptions
+        - Found {responsive_so_far} responsive documents
+        - Identified {exemptions_so_far} documents with exemptions
         """)
     
     # Navigate to results
@@ -916,6 +1655,144 @@ def processing_page():
             st.rerun()
 
 
+def _paginate(indices: List[int], key: str, page_size: int = RESULTS_PAGE_SIZE) -> List[int]:
+    """
+    Return the current page of indices, rendering prev/next controls when needed.
+    
+    Args:
+        indices: All email indices in the group
+        key: Session state key holding the current page number
+        page_size: Number of emails shown per page
+        
+    Returns:
+        Slice of indices for the current page
+    """
+    page_count = max(1, (len(indices) + page_size - 1) // page_size)
+    page = min(st.session_state.get(key, 0), page_count - 1)
+    
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("Previous", key=f"{key}_prev", disabled=page == 0):
+                st.session_state[key] = page - 1
+                st.rerun()
+        with col2:
+            st.caption(f"Page {page + 1} of {page_count} ({len(indices)} documents)")
+        with col3:
+            if st.button("Next", key=f"{key}_next", disabled=page == page_count - 1):
+                st.session_state[key] = page + 1
+                st.rerun()
+    
+    return indices[page * page_size:(page + 1) * page_size]
+
+
+def _render_responsive_group(groups: Dict[str, Any]):
+    """Render the responsive documents group of the results dashboard."""
+    responsive_emails = groups['responsive']
+    emails = st.session_state.emails
+    subjects = get_email_fields()['subjects']
+    responsiveness_results = st.session_state.responsiveness_results
+    exemption_results = st.session_state.exemption_results
+    st.markdown("#### Responsive Documents")
+    if responsive_emails:
+        for idx in _paginate(responsive_emails, 'responsive_page'):
+            email = emails[idx]
+            result = responsiveness_results[idx]
+            exemption_result = exemption_results[idx]
+            
+            with st.expander(subjects[idx]):
+                col1, col2 = st.columns([2, 1])
+                with col1:
+                    st.markdown(f"**From:** {email.from_address}")
+                    st.markdown(f"**Date:** {email.date}")
+                    st.markdown(f"**Responsive to:** Request(s) {', '.join(map(str, result.get_responsive_requests()))}")
+                with col2:
+                    st.markdown(f"**Confidence:** {result.confidence}")
+                    if exemption_result:
+                        exemptions = exemption_result.get_applicable_exemptions()
+                        if exemptions:
+                            st.markdown(f"**Exemptions:** {len(exemptions)}")
+    else:
+        st.info("No responsive documents found")
+
+
+def _render_non_responsive_group(groups: Dict[str, Any]):
+    """Render the non-responsive documents group of the results dashboard."""
+    non_responsive_emails = groups['non_responsive']
+    emails = st.session_state.emails
+    subjects = get_email_fields()['subjects']
+    st.markdown("#### Non-Responsive Documents")
+    if non_responsive_emails:
+        for idx in _paginate(non_responsive_emails, 'non_responsive_page'):
+            email = emails[idx]
+            
+            with st.expander(subjects[idx]):
+                st.markdown(f"**From:** {email.from_address}")
+                st.markdown(f"**Date:** {email.date}")
+                st.markdown("**Status:** Not responsive to any CPRA request")
+    else:
+        st.info("No non-responsive documents found")
+
+
+def _render_exemption_group(groups: Dict[str, Any]):
+    """Render the documents-with-exemptions group of the results dashboard."""
+    exemption_emails = groups['exemptions']
+    emails = st.session_state.emails
+    subjects = get_email_fields()['subjects']
+    exemption_results = st.session_state.exemption_results
+    st.markdown("#### Documents with Exemptions")
+    if exemption_emails:
+        for idx in _paginate(exemption_emails, 'exemption_page'):
+            email = emails[idx]
+            exemption_result = exemption_results[idx]
+            
+            with st.expander(subjects[idx]):
+                st.markdown(f"**From:** {email.from_address}")
+                st.markdown(f"**Date:** {email.date}")
+                st.markdown("**Exemptions:**")
+                exemptions = exemption_result.get_applicable_exemptions()
+                for exemption_type in exemptions:
+                    field_name, label = EXEMPTION_FIELDS[exemption_type.value]
+                    ex_data = getattr(exemption_result, field_name)
+                    st.markdown(f"- **{label}** ({ex_data['confidence'].value})")
+                    st.caption(ex_data['reasoning'])
+    else:
+        st.info("No documents with exemptions found")
+
+
+def _render_confidence_group(groups: Dict[str, Any]):
+    """Render the by-confidence group of the results dashboard."""
+    st.markdown("#### Documents by Confidence Level")
+    
+    subjects = get_email_fields()['subjects']
+    high_conf = groups['high_conf']
+    medium_conf = groups['medium_conf']
+    low_conf = groups['low_conf']
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(f"**High Confidence ({len(high_conf)})**")
+        for idx in high_conf[:5]:  # Show first 5
+            st.caption(f"• {subjects[idx]}")
+        if len(high_conf) > 5:
+            st.caption(f"...and {len(high_conf)-5} more")
+    
+    with col2:
+        st.markdown(f"**Medium Confidence ({len(medium_conf)})**")
+        for idx in medium_conf[:5]:
+            st.caption(f"• {subjects[idx]}")
+        if len(medium_conf) > 5:
+            st.caption(f"...and {len(medium_conf)-5} more")
+    
+    with col3:
+        st.markdown(f"**Low Confidence ({len(low_conf)})**")
+        for idx in low_conf[:5]:
+            st.caption(f"• {subjects[idx]}")
+        if len(low_conf) > 5:
+            st.caption(f"...and {len(low_conf)-5} more")
+
+
 def results_dashboard():
     """Results dashboard with document grouping and statistics."""
     st.title(" Results Dashboard")
@@ -929,12 +1806,10 @@ def results_dashboard():
     col1, col2, col3, col4 = st.columns(4)
     
     total_emails = len(st.session_state.emails)
-    responsive_emails = [i for i, r in enumerate(st.session_state.responsiveness_results) 
-                        if r and r.is_responsive_to_any()]
-    non_responsive_emails = [i for i, r in enumerate(st.session_state.responsiveness_results)
-                             if not r or not r.is_responsive_to_any()]
-    exemption_emails = [i for i, r in enumerate(st.session_state.exemption_results)
-                       if r and r.has_any_exemption()]
+    groups = get_result_groups()
+    responsive_emails = groups['responsive']
+    non_responsive_emails = groups['non_responsive']
+    exemption_emails = groups['exemptions']
     
     with col1:
         st.metric("Total Documents", total_emails)
@@ -949,118 +1824,23 @@ def results_dashboard():
     st.markdown("---")
     st.markdown("### Document Groups")
     
-    tab1, tab2, tab3, tab4 = st.tabs([
-        f" Responsive ({len(responsive_emails)})",
-        f" Non-Responsive ({len(non_responsive_emails)})",
-        f" With Exemptions ({len(exemption_emails)})",
-        " By Confidence"
-    ])
-    
-    with tab1:
-        st.markdown("#### Responsive Documents")
-        if responsive_emails:
-            for idx in responsive_emails:
-                email = st.session_state.emails[idx]
-                result = st.session_state.responsiveness_results[idx]
-                
-                with st.expander(f"{email.subject or '(No subject)'}"):
-                    col1, col2 = st.columns([2, 1])
-                    with col1:
-                        st.markdown(f"**From:** {email.from_address}")
-                        st.markdown(f"**Date:** {email.date}")
-                        st.markdown(f"**Responsive to:** Request(s) {', '.join(map(str, result.get_responsive_requests()))}")
-                    with col2:
-                        st.markdown(f"**Confidence:** {result.confidence}")
-                        if st.session_state.exemption_results[idx]:
-                            exemptions = st.session_state.exemption_results[idx].get_applicable_exemptions()
-                            if exemptions:
-                                st.markdown(f"**Exemptions:** {len(exemptions)}")
-        else:
-            st.info("No responsive documents found")
-    
-    with tab2:
-        st.markdown("#### Non-Responsive Documents")
-        if non_responsive_emails:
-            for idx in non_responsive_emails:
-                email = st.session_state.emails[idx]
-                
-                with st.expander(f"{email.subject or '(No subject)'}"):
-                    st.markdown(f"**From:** {email.from_address}")
-                    st.markdown(f"**Date:** {email.date}")
-                    st.markdown("**Status:** Not responsive to any CPRA request")
-        else:
-            st.info("No non-responsive documents found")
-    
-    with tab3:
-        st.markdown("#### Documents with Exemptions")
-        if exemption_emails:
-            for idx in exemption_emails:
-                email = st.session_state.emails[idx]
-                exemption_result = st.session_state.exemption_results[idx]
-                
-                with st.expander(f"{email.subject or '(No subject)'}"):
-                    st.markdown(f"**From:** {email.from_address}")
-                    st.markdown(f"**Date:** {email.date}")
-                    st.markdown("**Exemptions:**")
-                    exemptions = exemption_result.get_applicable_exemptions()
-                    for exemption_type in exemptions:
-                        if exemption_type == ExemptionType.ATTORNEY_CLIENT:
-                            ex_data = exemption_result.attorney_client
-                            st.markdown(f"- **Attorney-Client Privilege** ({ex_data['confidence'].value})")
-                            st.caption(ex_data['reasoning'])
-                        elif exemption_type == ExemptionType.PERSONNEL:
-                            ex_data = exemption_result.personnel
-                            st.markdown(f"- **Personnel Records** ({ex_data['confidence'].value})")
-                            st.caption(ex_data['reasoning'])
-                        elif exemption_type == ExemptionType.DELIBERATIVE:
-                            ex_data = exemption_result.deliberative
-                            st.markdown(f"- **Deliberative Process** ({ex_data['confidence'].value})")
-                            st.caption(ex_data['reasoning'])
-        else:
-            st.info("No documents with exemptions found")
-    
-    with tab4:
-        st.markdown("#### Documents by Confidence Level")
-        
-        # Group by confidence
-        high_conf = []
-        medium_conf = []
-        low_conf = []
-        
-        for i, result in enumerate(st.session_state.responsiveness_results):
-            if result:
-                if result.confidence == "HIGH":
-                    high_conf.append(i)
-                elif result.confidence == "MEDIUM":
-                    medium_conf.append(i)
-                elif result.confidence == "LOW":
-                    low_conf.append(i)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"**High Confidence ({len(high_conf)})**")
-            for idx in high_conf[:5]:  # Show first 5
-                email = st.session_state.emails[idx]
-                st.caption(f"• {email.subject or '(No subject)'}")
-            if len(high_conf) > 5:
-                st.caption(f"...and {len(high_conf)-5} more")
-        
-        with col2:
-            st.markdown(f"**Medium Confidence ({len(medium_conf)})**")
-            for idx in medium_conf[:5]:
-                email = st.session_state.emails[idx]
-                st.caption(f"• {email.subject or '(No subject)'}")
-            if len(medium_conf) > 5:
-                st.caption(f"...and {len(medium_conf)-5} more")
-        
-        with col3:
-            st.markdown(f"**Low Confidence ({len(low_conf)})**")
-            for idx in low_conf[:5]:
-                email = st.session_state.emails[idx]
-                st.caption(f"• {email.subject or '(No subject)'}")
-            if len(low_conf) > 5:
-                st.caption(f"...and {len(low_conf)-5} more")
+    # Only the selected group is rendered; st.tabs would build every tab on each rerun
+    views = {
+        f" Responsive ({len(responsive_emails)})": _render_responsive_group,
+        f" Non-Responsive ({len(non_responsive_emails)})": _render_non_responsive_group,
+        f" With Exemptions ({len(exemption_emails)})": _render_exemption_group,
+        " By Confidence": _render_confidence_group
+    }
+    # The labels carry live counts, so the selection is remembered by position
+    selected = st.radio(
+        "View",
+        list(views),
+        index=st.session_state.get('dashboard_view', 0),
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    st.session_state.dashboard_view = list(views).index(selected)
+    views[selected](groups)
     
     # Action buttons
     st.markdown("---")
@@ -1071,6 +1851,72 @@ def results_dashboard():
             st.rerun()
 
 
+def _go_to_review_index(index: int):
+    """Move the review page to a document (button callback)."""
+    st.session_state.current_review_index = index
+
+
+def _save_review(current_idx: int, email_id: str,
+                 responsiveness: Optional[ResponsivenessAnalysis],
+                 exemptions: Optional[ExemptionAnalysis]):
+    """
+    Save the reviewer's decision for a document and advance to the next one
+    (button callback).
+    
+    Args:
+        current_idx: Index of the reviewed email
+        email_id: Review ID of the email
+        responsiveness: AI responsiveness analysis for the email
+        exemptions: AI exemption analysis for the email
+    """
+    review_manager = st.session_state.review_manager
+    document_reviews = st.session_state.session.document_reviews
+    
+    # Get or ensure current review exists
+    current_review = document_reviews.get(email_id)
+    if not current_review:
+        current_review = DocumentReview(
+            email_id=email_id,
+            review_status=ReviewStatus.PENDING
+        )
+        document_reviews[email_id] = current_review
+    
+    # Start review if not started
+    if current_review.review_status == ReviewStatus.PENDING:
+        review_manager.start_review(current_review)
+    
+    # Apply responsiveness override
+    # Since we have one checkbox for overall responsiveness, apply to all requests
+    is_responsive = st.session_state[f"responsive_{current_idx}"]
+    if responsiveness:
+        # Every request gets the same decision, so the override map is rebuilt whole
+        current_review.user_responsive_override = dict.fromkeys(
+            range(len(responsiveness.responsive)), is_responsive
+        )
+    
+    # Apply exemption overrides, keyed with the review manager's ExemptionType:
+    # it is imported via utils.data_structures, a different class from ours
+    from src.processors.review_manager import ExemptionType as ReviewExemptionType
+    selected_exemptions = set(st.session_state[f"exemptions_{current_idx}"])
+    current_review.user_exemption_override = {
+        ReviewExemptionType(exemption_type.value): exemption_type in selected_exemptions
+        for exemption_type, _, _ in EXEMPTION_OPTIONS
+    }
+    
+    # Finalize review with the analysis results
+    review_manager.finalize_review(
+        current_review,
+        responsiveness_analysis=responsiveness,
+        exemption_analysis=exemptions
+    )
+    st.session_state.review_version += 1
+    st.toast(" Review saved!")
+    
+    # Auto-advance to next document
+    if current_idx < len(st.session_state.emails) - 1:
+        st.session_state.current_review_index = current_idx + 1
+
+
 def review_page():
     """Document review interface."""
     st.title(" Document Review")
@@ -1084,26 +1930,33 @@ def review_page():
     current_idx = st.session_state.current_review_index
     
     # Review progress
-    summary = review_manager.get_review_summary(st.session_state.session)
+    summary = get_review_summary()
     completed = summary['review_status']['completed']
     total = summary['total_documents']
     st.progress(completed / total if total > 0 else 0)
     st.markdown(f"**Review Progress:** {completed} of {total} documents reviewed")
     
-    # Navigation
+    # Navigation (callbacks update the index before the click's own rerun;
+    # a disabled button never fires, so the targets need no clamping)
     col1, col2, col3 = st.columns([1, 3, 1])
     with col1:
-        if st.button("← Previous", disabled=current_idx <= 0):
-            st.session_state.current_review_index = max(0, current_idx - 1)
-            st.rerun()
+        st.button(
+            "← Previous",
+            disabled=current_idx <= 0,
+            on_click=_go_to_review_index,
+            args=(current_idx - 1,)
+        )
     
     with col2:
         st.markdown(f"### Document {current_idx + 1} of {len(emails)}")
     
     with col3:
-        if st.button("Next →", disabled=current_idx >= len(emails) - 1):
-            st.session_state.current_review_index = min(len(emails) - 1, current_idx + 1)
-            st.rerun()
+        st.button(
+            "Next →",
+            disabled=current_idx >= len(emails) - 1,
+            on_click=_go_to_review_index,
+            args=(current_idx + 1,)
+        )
     
     st.markdown("---")
     
@@ -1127,7 +1980,9 @@ def review_page():
             
             # Email body
             st.markdown("**Content:**")
-            st.text_area("Email Body", email.body, height=300, disabled=True)
+            # Scrollable static text; a disabled text_area still round-trips as widget state
+            with st.container(height=300, border=True):
+                st.text(email.body)
         
         with col2:
             st.markdown("###  AI Analysis")
@@ -1149,21 +2004,11 @@ def review_page():
             if exemptions and exemptions.has_any_exemption():
                 applicable_exemptions = exemptions.get_applicable_exemptions()
                 for exemption_type in applicable_exemptions:
-                    if exemption_type == ExemptionType.ATTORNEY_CLIENT:
-                        ex_data = exemptions.attorney_client
-                        st.warning(f" Attorney-Client Privilege")
-                        st.caption(f"Confidence: {ex_data['confidence'].value}")
-                        st.caption(f"Reasoning: {ex_data['reasoning']}")
-                    elif exemption_type == ExemptionType.PERSONNEL:
-                        ex_data = exemptions.personnel
-                        st.warning(f" Personnel Records")
-                        st.caption(f"Confidence: {ex_data['confidence'].value}")
-                        st.caption(f"Reasoning: {ex_data['reasoning']}")
-                    elif exemption_type == ExemptionType.DELIBERATIVE:
-                        ex_data = exemptions.deliberative
-                        st.warning(f" Deliberative Process")
-                        st.caption(f"Confidence: {ex_data['confidence'].value}")
-                        st.caption(f"Reasoning: {ex_data['reasoning']}")
+                    field_name, label = EXEMPTION_FIELDS[exemption_type.value]
+                    ex_data = getattr(exemptions, field_name)
+                    st.warning(f" {label}")
+                    st.caption(f"Confidence: {ex_data['confidence'].value}")
+                    st.caption(f"Reasoning: {ex_data['reasoning']}")
             else:
                 st.success(" No exemptions identified")
             
@@ -1174,7 +2019,7 @@ def review_page():
             
             # Get current review state
             # Use the same email_id format as the review manager
-            email_id = email.message_id if email.message_id else f"email_{current_idx}"
+            email_id = get_email_fields()['ids'][current_idx]
             current_review = st.session_state.session.document_reviews.get(email_id)
             
             # Responsiveness override
@@ -1185,80 +2030,32 @@ def review_page():
             )
             
             # Exemption overrides
-            st.markdown("**Exemptions:**")
-            exemption_overrides = {}
-            
-            attorney_client = st.checkbox(
-                "Attorney-Client Privilege",
-                value=(current_review and ExemptionType.ATTORNEY_CLIENT in current_review.final_exemptions) if current_review else (exemptions.attorney_client["applies"] if exemptions else False),
-                key=f"attorney_{current_idx}"
-            )
-            
-            personnel = st.checkbox(
-                "Personnel Records",
-                value=(current_review and ExemptionType.PERSONNEL in current_review.final_exemptions) if current_review else (exemptions.personnel["applies"] if exemptions else False),
-                key=f"personnel_{current_idx}"
+            final_exemptions = frozenset(t.value for t in current_review.final_exemptions) if current_review else frozenset()
+            if current_review:
+                default_exemptions = [t for t, _, _ in EXEMPTION_OPTIONS if t.value in final_exemptions]
+            elif exemptions:
+                default_exemptions = [t for t, _, analysis_field in EXEMPTION_OPTIONS if getattr(exemptions, analysis_field)["applies"]]
+            else:
+                default_exemptions = []
+            st.multiselect(
+                "Exemptions",
+                options=[t for t, _, _ in EXEMPTION_OPTIONS],
+                default=default_exemptions,
+                format_func=EXEMPTION_LABELS.get,
+                key=f"exemptions_{current_idx}"
             )
             
-            deliberative = st.checkbox(
-                "Deliberative Process",
-                value=(current_review and ExemptionType.DELIBERATIVE in current_review.final_exemptions) if current_review else (exemptions.deliberative["applies"] if exemptions else False),
-                key=f"deliberative_{current_idx}"
+            # Save review button; the callback saves and advances before the click's rerun
+            st.button(
+                " Save Review",
+                type="primary",
+                use_container_width=True,
+                on_click=_save_review,
+                args=(current_idx, email_id, responsiveness, exemptions)
             )
-            
-            # Build exemption overrides dictionary
-            exemption_overrides = {}
-            if current_review:
-                if current_review.user_exemption_override is None:
-                    current_review.user_exemption_override = {}
-            exemption_overrides[ExemptionType.ATTORNEY_CLIENT] = attorney_client
-            exemption_overrides[ExemptionType.PERSONNEL] = personnel
-            exemption_overrides[ExemptionType.DELIBERATIVE] = deliberative
-            
-            # Save review button
-            if st.button(" Save Review", type="primary", use_container_width=True):
-                # Get or ensure current review exists
-                if not current_review:
-                    # Create a new review if it doesn't exist
-                    from src.utils.data_structures import DocumentReview
-                    current_review = DocumentReview(
-                        email_id=email_id,
-                        review_status=ReviewStatus.PENDING
-                    )
-                    st.session_state.session.document_reviews[email_id] = current_review
-                
-                if current_review:
-                    # Start review if not started
-                    if current_review.review_status == ReviewStatus.PENDING:
-                        review_manager.start_review(current_review)
-                    
-                    # Apply responsiveness override
-                    # Since we have one checkbox for overall responsiveness, apply to all requests
-                    if responsiveness:
-                        for i in range(len(responsiveness.responsive)):
-                            if current_review.user_responsive_override is None:
-                                current_review.user_responsive_override = {}
-                            current_review.user_responsive_override[i] = is_responsive
-                    
-                    # Apply exemption overrides
-                    current_review.user_exemption_override = exemption_overrides
-                    
-                    # Finalize review with the analysis results
-                    review_manager.finalize_review(
-                        current_review,
-                        responsiveness_analysis=responsiveness,
-                        exemption_analysis=exemptions
-                    )
-                
-                st.success(" Review saved!")
-                
-                # Auto-advance to next document
-                if current_idx < len(emails) - 1:
-                    st.session_state.current_review_index = current_idx + 1
-                    st.rerun()
     
     # Check if all reviews complete
-    summary = review_manager.get_review_summary(st.session_state.session)
+    summary = get_review_summary()
     if summary['review_status']['completed'] == summary['total_documents']:
         st.session_state.review_complete = True
         st.success(" All documents reviewed!")
@@ -1278,39 +2075,16 @@ def export_page():
         st.error("Review not complete")
         return
     
-    # Initialize export manager if needed
-    if not st.session_state.export_manager:
-        st.session_state.export_manager = ExportManager(
-            output_dir="data/test_exports"
-        )
-    
-    export_manager = st.session_state.export_manager
+    export_manager = get_export_manager("data/test_exports")
+    export_version = (st.session_state.review_version, st.session_state.results_version)
     
     # Export summary
     st.markdown("###  Export Summary")
     
-    # Get final determinations
-    final_determinations = []
-    for i, email in enumerate(st.session_state.emails):
-        email_id = email.message_id if email.message_id else f"email_{i}"
-        review = st.session_state.session.document_reviews.get(email_id)
-        if review:
-            final_determinations.append({
-                'responsive': any(review.final_responsive) if review.final_responsive else False,
-                'exemptions': review.final_exemptions
-            })
-        else:
-            # Use AI results if no review exists
-            responsiveness = st.session_state.responsiveness_results[i] if i < len(st.session_state.responsiveness_results) else None
-            exemptions = st.session_state.exemption_results[i] if i < len(st.session_state.exemption_results) else None
-            final_determinations.append({
-                'responsive': responsiveness.is_responsive_to_any() if responsiveness else False,
-                'exemptions': {ex.exemption_type: ex.reasoning for ex in exemptions.exemptions} if exemptions and exemptions.exemptions else {}
-            })
-    
-    responsive_count = sum(1 for d in final_determinations if d['responsive'])
-    exempt_count = sum(1 for d in final_determinations if d['exemptions'])
-    producible_count = sum(1 for d in final_determinations if d['responsive'] and not d['exemptions'])
+    counts = get_final_determination_counts()
+    responsive_count = counts['responsive']
+    exempt_count = counts['exempt']
+    producible_count = counts['producible']
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -1333,89 +2107,67 @@ def export_page():
         st.info(f"Export {producible_count} responsive documents without exemptions")
         
         if st.button(" Generate Production PDF", type="primary", use_container_width=True):
-            with st.spinner("Generating production PDF..."):
-                try:
-                    export_dir = Path("data/test_exports")
-                    export_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    result = export_manager.generate_exports(st.session_state.session)
-                    
-                    if result['production_pdf']:
-                        st.success(f" Production PDF created: {Path(result['production_pdf']).name}")
-                    else:
-                        st.warning("No documents to export in production PDF")
-                except Exception as e:
-                    st.error(f"Error generating production PDF: {str(e)}")
+            st.session_state.export_request = ('production', export_version)
+        
+        result = poll_exports(export_manager, 'production', "Error generating production PDF")
+        if result is not None:
+            if result['production_pdf']:
+                st.success(f" Production PDF created: {Path(result['production_pdf']).name}")
+            else:
+                st.warning("No documents to export in production PDF")
     
     with col2:
         st.markdown("#### Privilege Log")
         st.info(f"Document {exempt_count} withheld documents with exemptions")
         
         if st.button(" Generate Privilege Log", type="secondary", use_container_width=True):
-            with st.spinner("Generating privilege log..."):
-                try:
-                    export_dir = Path("data/test_exports")
-                    export_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    result = export_manager.generate_exports(st.session_state.session)
-                    
-                    if result['privilege_log_csv']:
-                        st.success(f" Privilege log CSV created: {Path(result['privilege_log_csv']).name}")
-                    if result['privilege_log_pdf']:
-                        st.success(f" Privilege log PDF created: {Path(result['privilege_log_pdf']).name}")
-                    
-                    if not result['privilege_log_csv'] and not result['privilege_log_pdf']:
-                        st.info("No withheld documents requiring privilege log")
-                except Exception as e:
-                    st.error(f"Error generating privilege log: {str(e)}")
+            st.session_state.export_request = ('privilege_log', export_version)
+        
+        result = poll_exports(export_manager, 'privilege_log', "Error generating privilege log")
+        if result is not None:
+            if result['privilege_log_csv']:
+                st.success(f" Privilege log CSV created: {Path(result['privilege_log_csv']).name}")
+            if result['privilege_log_pdf']:
+                st.success(f" Privilege log PDF created: {Path(result['privilege_log_pdf']).name}")
+            
+            if not result['privilege_log_csv'] and not result['privilege_log_pdf']:
+                st.info("No withheld documents requiring privilege log")
     
     # Full export
     st.markdown("---")
     st.markdown("###  Complete Export Package")
     
     if st.button(" Generate All Export Files", type="primary", use_container_width=True):
-        with st.spinner("Generating complete export package..."):
-            try:
-                export_dir = Path("data/test_exports")
-                export_dir.mkdir(parents=True, exist_ok=True)
-                
-                result = export_manager.generate_exports(st.session_state.session)
-                
-                st.success(" Export complete!")
-                
-                # Show results
-                st.markdown("#### Generated Files:")
-                if result['production_pdf']:
-                    st.markdown(f"-  Production PDF: `{Path(result['production_pdf']).name}`")
-                if result['privilege_log_csv']:
-                    st.markdown(f"-  Privilege Log CSV: `{Path(result['privilege_log_csv']).name}`")
-                if result['privilege_log_pdf']:
-                    st.markdown(f"-  Privilege Log PDF: `{Path(result['privilege_log_pdf']).name}`")
-                if result['summary_report']:
-                    st.markdown(f"-  Summary Report: `{Path(result['summary_report']).name}`")
-                if result['manifest']:
-                    st.markdown(f"-  Export Manifest: `{Path(result['manifest']).name}`")
-                
-                st.info(f"All files saved to: `{export_dir}`")
-                
-            except Exception as e:
-                st.error(f"Error during export: {str(e)}")
+        st.session_state.export_request = ('all', export_version)
+    
+    result = poll_exports(export_manager, 'all', "Error during export")
+    if result is not None:
+        st.success(" Export complete!")
+        
+        # Show results
+        st.markdown("#### Generated Files:")
+        if result['production_pdf']:
+            st.markdown(f"-  Production PDF: `{Path(result['production_pdf']).name}`")
+        if result['privilege_log_csv']:
+            st.markdown(f"-  Privilege Log CSV: `{Path(result['privilege_log_csv']).name}`")
+        if result['privilege_log_pdf']:
+            st.markdown(f"-  Privilege Log PDF: `{Path(result['privilege_log_pdf']).name}`")
+        if result['summary_report']:
+            st.markdown(f"-  Summary Report: `{Path(result['summary_report']).name}`")
+        if result['manifest']:
+            st.markdown(f"-  Export Manifest: `{Path(result['manifest']).name}`")
+        
+        st.info(f"All files saved to: `{export_manager.output_dir}`")
     
     # Session save option
     st.markdown("---")
     st.markdown("###  Save Session")
     
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     with col1:
         if st.button("Save Session (JSON)", type="secondary"):
             try:
-                session_manager = SessionManager()
-                filepath = session_manager.save_session(
-                    st.session_state.session,
-                    st.session_state.emails,
-                    st.session_state.review_manager,
-                    format='json'
-                )
+                filepath = save_session_file('json')
                 st.success(f" Session saved: {Path(filepath).name}")
             except Exception as e:
                 st.error(f"Error saving session: {str(e)}")
@@ -1423,16 +2175,26 @@ def export_page():
     with col2:
         if st.button("Save Session (Pickle)", type="secondary"):
             try:
-                session_manager = SessionManager()
-                filepath = session_manager.save_session(
-                    st.session_state.session,
-                    st.session_state.emails,
-                    st.session_state.review_manager,
-                    format='pickle'
-                )
+                filepath = save_session_file('pickle')
+                st.success(f" Session saved: {Path(filepath).name}")
+            except Exception as e:
+                st.error(f"Error saving session: {str(e)}")
+    
+    with col3:
+        if st.button("Save Session (Fast)", type="secondary"):
+            try:
+                filepath = save_session_file('compressed')
                 st.success(f" Session saved: {Path(filepath).name}")
             except Exception as e:
                 st.error(f"Error saving session: {str(e)}")
+    
+    # Check on a running export from a fresh run once the whole page has
+    # rendered, rather than holding this run until the files are written
+    job = st.session_state.export_job
+    request = st.session_state.export_request
+    if job is not None and job[0] == export_version and request is not None and request[1] == export_version:
+        time.sleep(EXPORT_POLL_INTERVAL)
+        st.rerun()
 
 
 def main():
@@ -18,6 +18,31 @@ from typing import Dict, Optional, Any, List, Tuple
 from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+# Section markers in the structured CPRA analysis prompt
+REQUESTS_MARKER = "CPRA REQUEST(S) TO ANALYZE:"
+EMAIL_MARKER = "EMAIL DOCUMENT TO ANALYZE:"
+
+# Display colors for model confidence levels
+CONFIDENCE_COLORS = {
+    "high": "green",
+    "medium": "orange",
+    "low": "red"
+}
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate a token count at about four characters per token.
+    
+    Empty text counts as zero tokens; any other text counts as at least one.
+    """
+    return max(1, len(text) >> 2) if text else 0
+
 
 class StreamEventType(Enum):
     """Types of streaming events."""
@@ -49,7 +74,8 @@ class LLMStreamDisplay:
             container: Streamlit container to render in
             
         Returns:
-            Dictionary of sub-containers for updates
+            Dictionary of sub-containers for updates; 'output' is an
+            st.empty() placeholder
         """
         with container:
             st.markdown("### AI Processing Stream")
@@ -67,7 +93,8 @@ class LLMStreamDisplay:
                     
                 with stream_col2:
                     st.markdown("#### AI Response")
-                    output_container = st.container()
+                    # Placeholder so each streaming update replaces the last
+                    output_container = st.empty()
                     
             with tab2:
                 # Current analysis details
@@ -127,22 +154,21 @@ class LLMStreamDisplay:
             content: The prompt content
         """
         # Extract CPRA requests
-        if "CPRA REQUEST(S) TO ANALYZE:" in content:
-            parts = content.split("CPRA REQUEST(S) TO ANALYZE:")
-            if len(parts) > 1:
-                request_part = parts[1].split("EMAIL DOCUMENT TO ANALYZE:")[0]
-                email_part = parts[1].split("EMAIL DOCUMENT TO ANALYZE:")[1] if "EMAIL DOCUMENT TO ANALYZE:" in parts[1] else ""
-                
-                # Display CPRA requests
-                st.markdown("**CPRA Requests to evaluate:**")
-                for line in request_part.strip().split('\n'):
-                    if line.strip() and line.strip().startswith("Request"):
-                        st.markdown(f"- {line.strip()}")
-                
-                # Display email preview
-                if email_part:
-                    with st.expander("Email document being analyzed"):
-                        st.text(email_part[:500] + "..." if len(email_part) > 500 else email_part)
+        _, found, rest = content.partition(REQUESTS_MARKER)
+        if not found:
+            return
+        request_part, _, email_part = rest.partition(EMAIL_MARKER)
+        
+        # Display CPRA requests
+        st.markdown("**CPRA Requests to evaluate:**")
+        for line in request_part.strip().split('\n'):
+            if line.strip() and line.strip().startswith("Request"):
+                st.markdown(f"- {line.strip()}")
+        
+        # Display email preview
+        if email_part:
+            with st.expander("Email document being analyzed"):
+                st.text(email_part[:500] + "..." if len(email_part) > 500 else email_part)
     
     def display_response_stream(self, container, response_chunk: str, 
                                is_complete: bool = False):
@@ -150,17 +176,21 @@ class LLMStreamDisplay:
         Display streaming response from the AI.
         
         Args:
-            container: Container to display in
+            container: Container to display in; pass an st.empty() placeholder
+                to replace the previous update instead of appending to it
             response_chunk: Chunk of response text
             is_complete: Whether this is the complete response
         """
-        with container:
+        with container.container():
             if is_complete:
                 # Try to parse as JSON for better display
                 try:
-                    response_json = json.loads(response_chunk)
+                    if orjson is not None:
+                        response_json = orjson.loads(response_chunk)
+                    else:
+                        response_json = json.loads(response_chunk)
                     self._display_formatted_response(response_json)
-                except json.JSONDecodeError:
+                except ValueError:  # orjson.JSONDecodeError and json.JSONDecodeError both subclass it
                     # Display as text if not JSON
                     st.code(response_chunk, language="text")
             else:
@@ -176,8 +206,8 @@ class LLMStreamDisplay:
             response_json: Parsed JSON response
         """
         if "responsive" in response_json:
-            # Responsiveness analysis result
-            st.markdown("**Responsiveness Analysis Result:**")
+            # Responsiveness analysis result, rendered as one markdown block
+            lines = ["**Responsiveness Analysis Result:**", ""]
             
             responsive_list = response_json.get("responsive", [])
             confidence_list = response_json.get("confidence", [])
@@ -187,21 +217,18 @@ class LLMStreamDisplay:
                 zip(responsive_list, confidence_list, reasoning_list)
             ):
                 status_emoji = "✅" if responsive else "❌"
-                confidence_color = {
-                    "high": "green",
-                    "medium": "orange", 
-                    "low": "red"
-                }.get(confidence.lower(), "gray")
+                confidence_color = CONFIDENCE_COLORS.get(confidence.lower(), "gray")
                 
-                st.markdown(f"""
-                **Request {i+1}:** {status_emoji} {'Responsive' if responsive else 'Not Responsive'}
-                - **Confidence:** :{confidence_color}[{confidence}]
-                - **Reasoning:** {reasoning}
-                """)
+                lines.append(f"**Request {i+1}:** {status_emoji} {'Responsive' if responsive else 'Not Responsive'}")
+                lines.append(f"- **Confidence:** :{confidence_color}[{confidence}]")
+                lines.append(f"- **Reasoning:** {reasoning}")
+                lines.append("")
+            
+            st.markdown("\n".join(lines))
                 
         elif "exemptions" in response_json:
-            # Exemption analysis result
-            st.markdown("**Exemption Analysis Result:**")
+            # Exemption analysis result, rendered as one markdown block
+            lines = ["**Exemption Analysis Result:**", ""]
             
             exemptions = response_json.get("exemptions", {})
             
@@ -213,11 +240,12 @@ class LLMStreamDisplay:
                     emoji = "✅"
                     status = "None"
                     
-                st.markdown(f"""
-                **{exemption_type.replace('_', ' ').title()}:** {emoji} {status}
-                - **Confidence:** {data.get('confidence', 'unknown')}
-                - **Reasoning:** {data.get('reasoning', 'No reasoning provided')}
-                """)
+                lines.append(f"**{exemption_type.replace('_', ' ').title()}:** {emoji} {status}")
+                lines.append(f"- **Confidence:** {data.get('confidence', 'unknown')}")
+                lines.append(f"- **Reasoning:** {data.get('reasoning', 'No reasoning provided')}")
+                lines.append("")
+            
+            st.markdown("\n".join(lines))
         else:
             # Generic JSON display
             st.json(response_json)
@@ -228,11 +256,12 @@ class LLMStreamDisplay:
         Display current processing status.
         
         Args:
-            container: Container to display in
+            container: Container to display in; pass an st.empty() placeholder
+                to replace the previous status instead of appending to it
             status: Status message
             email_info: Information about current email
         """
-        with container:
+        with container.container():
             if email_info:
                 st.info(f"""
                 **Currently Processing:**
@@ -346,6 +375,10 @@ class StreamCallback:
         self.containers = containers
         self.start_time = None
         self.current_response = ""
+        self._chunks = []
+        self._render_every = 8  # Re-render the partial response every N chunks...
+        self._render_interval = 0.05  # ...or once this many seconds have passed
+        self._last_render = 0.0
         self.metrics = {
             'prompt_tokens': 0,
             'response_tokens': 0,
@@ -363,7 +396,7 @@ class StreamCallback:
             metadata: Optional metadata
         """
         # Estimate token count (rough approximation)
-        self.metrics['prompt_tokens'] = len(content.split()) * 1.3
+        self.metrics['prompt_tokens'] = _estimate_tokens(content)
         
         if 'input' in self.containers:
             self.display.display_prompt(
@@ -382,6 +415,8 @@ class StreamCallback:
         """
         self.start_time = time.time()
         self.current_response = ""
+        self._chunks = []
+        self._last_render = 0.0
         
         if 'output' in self.containers:
             self.display.display_processing_status(
@@ -397,12 +432,18 @@ class StreamCallback:
         Args:
             chunk: Chunk of response text
         """
-        self.current_response += chunk
+        # Collect chunks in a list; joining on every token would be quadratic
+        self._chunks.append(chunk)
+        
+        now = time.time()
+        if len(self._chunks) % self._render_every and now - self._last_render < self._render_interval:
+            return
+        self._last_render = now
         
         if 'output' in self.containers:
             self.display.display_response_stream(
                 self.containers['output'],
-                self.current_response,
+                "".join(self._chunks),
                 is_complete=False
             )
     
@@ -416,9 +457,10 @@ class StreamCallback:
         """
         if self.start_time:
             self.metrics['processing_time'] = time.time() - self.start_time
+        self.current_response = "".join(self._chunks)
         
         # Estimate response tokens
-        self.metrics['response_tokens'] = len(full_response.split()) * 1.3
+        self.metrics['response_tokens'] = _estimate_tokens(full_response)
         self.metrics['model'] = model
         
         if 'output' in self.containers:
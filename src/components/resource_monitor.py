@@ -11,24 +11,74 @@ Sprint 6 Implementation: System Resource Monitoring
 
 import streamlit as st
 import psutil
+import threading
 import time
 from typing import Dict, Optional
 from src.utils.demo_utils import (
     check_network_connectivity,
-    get_system_resources,
     estimate_model_memory_usage,
     format_bytes
 )
 
 
 class ResourceMonitor:
-    """System resource monitoring for demo mode."""
+    """
+    System resource monitoring for demo mode.
+    
+    Each instance runs its own sampler thread, so the app shares a single
+    process-wide monitor rather than creating one per session.
+    """
     
     def __init__(self):
-        """Initialize resource monitor."""
+        """Initialize resource monitor and start the background sampler."""
         self.last_update = time.time()
         self.update_interval = 1.0  # Update every second
         
+        # Latest resource snapshot, refreshed by the sampler thread so
+        # rendering never blocks on psutil
+        self._snapshot_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        psutil.cpu_percent(interval=None)  # Prime the non-blocking CPU counter
+        self._snapshot = self._sample_resources()
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+    
+    def _sample_resources(self) -> Dict[str, float]:
+        """
+        Take a non-blocking resource sample.
+        
+        Returns:
+            Dictionary in the same shape as get_system_resources()
+        """
+        memory = psutil.virtual_memory()
+        return {
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory_percent': memory.percent,
+            'memory_used_gb': memory.used / (1024**3),
+            'memory_total_gb': memory.total / (1024**3)
+        }
+    
+    def _sample_loop(self):
+        """Refresh the shared snapshot every update interval until stopped."""
+        while not self._stop_event.wait(self.update_interval):
+            snapshot = self._sample_resources()
+            with self._snapshot_lock:
+                self._snapshot = snapshot
+    
+    def stop(self):
+        """Stop the background sampler; the last snapshot stays readable."""
+        self._stop_event.set()
+    
+    def get_resources(self) -> Dict[str, float]:
+        """
+        Get the most recent resource snapshot.
+        
+        Returns:
+            Dictionary with CPU and memory usage
+        """
+        with self._snapshot_lock:
+            return dict(self._snapshot)
+        
     def create_resource_dashboard(self, container, model_name: str = "gemma3:latest"):
         """
         Create a resource monitoring dashboard.
@@ -38,7 +88,7 @@ class ResourceMonitor:
             model_name: Name of the active model
         """
         # Get current resources
-        resources = get_system_resources()
+        resources = self.get_resources()
         network_status, network_msg = check_network_connectivity()
         
         # Create columns for metrics
@@ -96,7 +146,7 @@ class ResourceMonitor:
         Args:
             container: Streamlit container to render in
         """
-        resources = get_system_resources()
+        resources = self.get_resources()
         network_status, network_msg = check_network_connectivity()
         
         container.markdown("### System Resources")
@@ -123,7 +173,7 @@ class ResourceMonitor:
             phase: Current processing phase
             model_active: Whether model is actively processing
         """
-        resources = get_system_resources()
+        resources = self.get_resources()
         
         # Create metrics row
         col1, col2, col3 = container.columns(3)
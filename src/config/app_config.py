@@ -49,6 +49,8 @@ class ProcessingConfig:
     processing_timeout_minutes: int = 10
     auto_save_interval: int = 10  # Save session every N documents
     enable_progress_callbacks: bool = True
+    enable_prompt_batching: bool = False  # Send batch_size emails per model call
+    enable_phase_pipelining: bool = False  # Check exemptions while responsiveness runs
     
     @classmethod
     def from_env(cls) -> 'ProcessingConfig':
@@ -59,7 +61,9 @@ class ProcessingConfig:
             max_concurrent_requests=int(os.getenv('CPRA_MAX_CONCURRENT', str(cls.max_concurrent_requests))),
             processing_timeout_minutes=int(os.getenv('CPRA_PROCESSING_TIMEOUT', str(cls.processing_timeout_minutes))),
             auto_save_interval=int(os.getenv('CPRA_AUTO_SAVE_INTERVAL', str(cls.auto_save_interval))),
-            enable_progress_callbacks=os.getenv('CPRA_ENABLE_CALLBACKS', 'true').lower() == 'true'
+            enable_progress_callbacks=os.getenv('CPRA_ENABLE_CALLBACKS', 'true').lower() == 'true',
+            enable_prompt_batching=os.getenv('CPRA_ENABLE_PROMPT_BATCHING', 'false').lower() == 'true',
+            enable_phase_pipelining=os.getenv('CPRA_ENABLE_PIPELINING', 'false').lower() == 'true'
         )
 
 
@@ -6,26 +6,183 @@ Handles communication with local Ollama service for CPRA document processing.
 import json
 import time
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 import ollama
 from ollama import ChatResponse
 
 
+# Static system prompt for exemption analysis, built once at import
+EXEMPTION_SYSTEM_PROMPT = """You are an expert legal assistant specializing in California Public Records Act (CPRA) exemptions.
+Your task is to identify potential exemptions that may apply to email content.
+
+EXEMPTION DEFINITIONS:
+
+1. ATTORNEY-CLIENT PRIVILEGE:
+   - Communications between attorney and client for legal advice
+   - Legal strategy discussions
+   - Attorney work product or legal analysis
+   - Must involve actual attorney-client relationship
+
+2. PERSONNEL RECORDS:
+   - Employee performance evaluations or reviews
+   - Disciplinary actions or investigations
+   - Personal employee information (medical, financial, private matters)
+   - HR-related confidential discussions about specific individuals
+
+3. DELIBERATIVE PROCESS:
+   - Pre-decisional discussions and recommendations
+   - Draft documents not yet finalized
+   - Internal policy discussions before final decisions
+   - Advisory opinions or preliminary analysis
+
+CONFIDENCE LEVELS:
+- "high": Clear, definitive indicators of exemption
+- "medium": Probable exemption with some indicators
+- "low": Possible exemption but uncertain
+
+You must respond with valid JSON only, using this exact format:
+{
+    "exemptions": {
+        "attorney_client": {"applies": true/false, "confidence": "high/medium/low", "reasoning": "brief explanation"},
+        "personnel": {"applies": true/false, "confidence": "high/medium/low", "reasoning": "brief explanation"},
+        "deliberative": {"applies": true/false, "confidence": "high/medium/low", "reasoning": "brief explanation"}
+    }
+}
+
+CRITICAL: Your response must be valid JSON with exactly the structure shown above."""
+
+
+# Responsiveness criteria shared by the single-email and batch prompts
+RESPONSIVENESS_GUIDELINES = """RESPONSIVENESS CRITERIA:
+- A document is "responsive" if it contains information that relates to, discusses, or provides evidence about the subject matter of the CPRA request
+- Consider both direct mentions and indirect relevance
+- Even partial relevance should be considered responsive
+- When in doubt, err on the side of finding documents responsive
+
+CONFIDENCE LEVELS:
+- "high": Clear, direct relevance to the request
+- "medium": Indirect or partial relevance to the request  
+- "low": Minimal or questionable relevance to the request"""
+
+
+@lru_cache(maxsize=16)
+def _responsiveness_system_prompt(request_count: int) -> str:
+    """
+    Build the responsiveness system prompt for a given number of requests.
+    
+    The prompt only varies with the request count, so it is cached and the
+    identical prefix lets Ollama reuse its prompt cache across emails.
+    
+    Args:
+        request_count: Number of CPRA requests being analyzed
+        
+    Returns:
+        System prompt text
+    """
+    return f"""You are an expert legal assistant specializing in California Public Records Act (CPRA) requests. 
+Your task is to determine if an email document is responsive to specific CPRA requests.
+
+{RESPONSIVENESS_GUIDELINES}
+
+IMPORTANT INSTRUCTIONS:
+- Analyze the ENTIRE email as a whole document
+- Provide ONE single assessment for EACH CPRA request
+- Do NOT analyze individual paragraphs or sections separately
+- Your arrays must have EXACTLY {request_count} element(s) - one per CPRA request
+
+You must respond with valid JSON only, using this exact format:
+{{
+    "responsive": [true/false for each request],
+    "confidence": ["high"/"medium"/"low" for each request],
+    "reasoning": ["brief explanation for each request"]
+}}
+
+Example for {request_count} request(s):
+{{
+    "responsive": [{', '.join(['true'] * request_count)}],
+    "confidence": [{', '.join(['"high"'] * request_count)}],
+    "reasoning": [{', '.join(['"The email directly discusses this topic"'] * request_count)}]
+}}
+
+CRITICAL: Each array must contain EXACTLY {request_count} element(s) - one element per CPRA request."""
+
+
+@lru_cache(maxsize=16)
+def _batch_responsiveness_system_prompt(request_count: int, email_count: int) -> str:
+    """
+    Build the system prompt for analyzing several emails in one generation.
+    
+    Args:
+        request_count: Number of CPRA requests being analyzed
+        email_count: Number of emails included in the prompt
+        
+    Returns:
+        System prompt text
+    """
+    return f"""You are an expert legal assistant specializing in California Public Records Act (CPRA) requests. 
+Your task is to determine, for each of several email documents, whether it is responsive to specific CPRA requests.
+
+{RESPONSIVENESS_GUIDELINES}
+
+IMPORTANT INSTRUCTIONS:
+- You will receive {email_count} separate email(s), each starting with an ===EMAIL N=== marker
+- Analyze each email independently and as a whole document
+- Provide ONE single assessment for EACH CPRA request within each email's object
+- Return the email objects in the same order as the emails
+
+You must respond with valid JSON only, using this exact format:
+{{
+    "emails": [
+        {{
+            "responsive": [true/false for each request],
+            "confidence": ["high"/"medium"/"low" for each request],
+            "reasoning": ["brief explanation for each request"]
+        }}
+    ]
+}}
+
+CRITICAL: The "emails" array must contain EXACTLY {email_count} object(s), and each object's arrays must contain EXACTLY {request_count} element(s)."""
+
+
+@lru_cache(maxsize=32)
+def _format_requests_block(cpra_requests: Tuple[str, ...]) -> str:
+    """
+    Format the numbered CPRA request block used in analysis prompts.
+    
+    The same requests are sent with every email in a run, so the block is
+    built once and reused.
+    
+    Args:
+        cpra_requests: CPRA request strings
+        
+    Returns:
+        Numbered request text
+    """
+    return "\n".join([f"Request {i+1}: {req}" for i, req in enumerate(cpra_requests)])
+
+
 class OllamaClient:
     """Client for interacting with local Ollama models."""
     
-    def __init__(self, host: str = "http://localhost:11434", timeout: int = 120):
+    def __init__(self, host: str = "http://localhost:11434", timeout: int = 120, **client_kwargs):
         """
         Initialize the Ollama client.
         
         Args:
             host: Ollama service host URL
             timeout: Request timeout in seconds
+            **client_kwargs: Extra options for the underlying httpx client
+                (e.g. connection pool limits)
         """
         self.host = host
         self.timeout = timeout
-        self.client = ollama.Client(host=host, timeout=timeout)
+        self.client = ollama.Client(host=host, timeout=timeout, **client_kwargs)
         self.logger = logging.getLogger(__name__)
+    
+    def close(self):
+        """Close the underlying HTTP connection pool."""
+        self.client.close()
         
     def test_connectivity(self) -> bool:
         """
@@ -97,6 +254,36 @@ class OllamaClient:
             self.logger.error(f"Model {model_name} test failed: {e}")
             return False, None, None
     
+    def preload_model(self, model_name: str, keep_alive: Union[str, int] = -1) -> bool:
+        """
+        Load a model into memory ahead of the first real request.
+        
+        With the default keep_alive of -1 the server holds the model in RAM
+        until it is explicitly unloaded or the server restarts. Each later
+        request resets the timer to its own keep_alive, so callers that want
+        the model to stay loaded should pass the same value to both.
+        
+        Args:
+            model_name: Name of the model to load
+            keep_alive: How long the model stays loaded (-1 for indefinitely)
+            
+        Returns:
+            True if the model was loaded, False otherwise
+        """
+        try:
+            start_time = time.time()
+            self.client.generate(
+                model=model_name,
+                prompt="",
+                keep_alive=keep_alive,
+                options={'num_predict': 1}
+            )
+            self.logger.info(f"Preloaded model {model_name} in {time.time() - start_time:.2f}s")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to preload model {model_name}: {e}")
+            return False
+    
     def generate_structured_response(
         self, 
         model_name: str, 
@@ -104,7 +291,8 @@ class OllamaClient:
         system_prompt: Optional[str] = None,
         temperature: float = 0.3,
         max_tokens: Optional[int] = None,
-        stream_callback: Optional[callable] = None
+        stream_callback: Optional[callable] = None,
+        keep_alive: Optional[str] = None
     ) -> Optional[str]:
         """
         Generate a response using the specified model with structured prompting.
@@ -116,6 +304,8 @@ class OllamaClient:
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
             stream_callback: Optional callback for streaming events
+            keep_alive: How long Ollama keeps the model loaded after the call
+                (e.g. "10m"); None uses the server default
             
         Returns:
             Generated response text or None if failed
@@ -149,7 +339,8 @@ class OllamaClient:
                     model=model_name,
                     messages=messages,
                     options=options,
-                    stream=True
+                    stream=True,
+                    keep_alive=keep_alive
                 )
                 
                 for chunk in stream:
@@ -165,7 +356,8 @@ class OllamaClient:
                 response = self.client.chat(
                     model=model_name,
                     messages=messages,
-                    options=options
+                    options=options,
+                    keep_alive=keep_alive
                 )
                 
                 return response['message']['content'].strip()
@@ -180,17 +372,22 @@ class OllamaClient:
         email_content: str, 
         cpra_requests: List[str],
         retry_attempts: int = 3,
-        stream_callback: Optional[callable] = None
+        stream_callback: Optional[callable] = None,
+        keep_alive: Optional[str] = None
     ) -> Optional[Dict]:
         """
         Analyze if an email is responsive to CPRA requests with enhanced prompting.
         
+        All requests are evaluated in a single generation so the email body is
+        only prefilled once regardless of how many requests are supplied.
+        
         Args:
             model_name: Model to use for analysis
             email_content: The email content to analyze
             cpra_requests: List of CPRA request strings
             retry_attempts: Number of retry attempts for failed requests
             stream_callback: Optional callback for streaming events
+            keep_alive: How long Ollama keeps the model loaded between calls
             
         Returns:
             Dictionary with analysis results or None if failed
@@ -204,44 +401,10 @@ class OllamaClient:
             self.logger.error("No email content provided for analysis")
             return None
             
-        system_prompt = f"""You are an expert legal assistant specializing in California Public Records Act (CPRA) requests. 
-Your task is to determine if an email document is responsive to specific CPRA requests.
-
-RESPONSIVENESS CRITERIA:
-- A document is "responsive" if it contains information that relates to, discusses, or provides evidence about the subject matter of the CPRA request
-- Consider both direct mentions and indirect relevance
-- Even partial relevance should be considered responsive
-- When in doubt, err on the side of finding documents responsive
-
-CONFIDENCE LEVELS:
-- "high": Clear, direct relevance to the request
-- "medium": Indirect or partial relevance to the request  
-- "low": Minimal or questionable relevance to the request
-
-IMPORTANT INSTRUCTIONS:
-- Analyze the ENTIRE email as a whole document
-- Provide ONE single assessment for EACH CPRA request
-- Do NOT analyze individual paragraphs or sections separately
-- Your arrays must have EXACTLY {len(cpra_requests)} element(s) - one per CPRA request
-
-You must respond with valid JSON only, using this exact format:
-{{
-    "responsive": [true/false for each request],
-    "confidence": ["high"/"medium"/"low" for each request],
-    "reasoning": ["brief explanation for each request"]
-}}
-
-Example for {len(cpra_requests)} request(s):
-{{
-    "responsive": [{', '.join(['true'] * len(cpra_requests))}],
-    "confidence": [{', '.join(['"high"'] * len(cpra_requests))}],
-    "reasoning": [{', '.join(['"The email directly discusses this topic"'] * len(cpra_requests))}]
-}}
-
-CRITICAL: Each array must contain EXACTLY {len(cpra_requests)} element(s) - one element per CPRA request."""
+        system_prompt = _responsiveness_system_prompt(len(cpra_requests))
         
         # Format the requests with clear numbering
-        requests_text = "\n".join([f"Request {i+1}: {req}" for i, req in enumerate(cpra_requests)])
+        requests_text = _format_requests_block(tuple(cpra_requests))
         
         prompt = f"""Analyze this email for responsiveness to the following CPRA request(s):
 
@@ -274,7 +437,8 @@ Analyze the email as a WHOLE DOCUMENT, not paragraph by paragraph."""
                     system_prompt=system_prompt,
                     temperature=0.2,
                     max_tokens=800,
-                    stream_callback=stream_callback
+                    stream_callback=stream_callback,
+                    keep_alive=keep_alive
                 )
                 
                 if not response:
@@ -328,6 +492,87 @@ Analyze the email as a WHOLE DOCUMENT, not paragraph by paragraph."""
         
         return None
     
+    def analyze_responsiveness_batch(
+        self,
+        model_name: str,
+        email_contents: List[str],
+        cpra_requests: List[str],
+        retry_attempts: int = 3,
+        keep_alive: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Analyze several emails for responsiveness in a single generation.
+        
+        The system prompt and CPRA requests are sent once for the whole batch
+        instead of once per email.
+        
+        Args:
+            model_name: Model to use for analysis
+            email_contents: Email contents to analyze, in order
+            cpra_requests: List of CPRA request strings
+            retry_attempts: Number of retry attempts for failed requests
+            keep_alive: How long Ollama keeps the model loaded between calls
+            
+        Returns:
+            List of per-email analysis dictionaries in input order, or None if
+            the batch could not be analyzed
+        """
+        if not cpra_requests or not email_contents:
+            self.logger.error("No CPRA requests or emails provided for batch analysis")
+            return None
+        
+        system_prompt = _batch_responsiveness_system_prompt(len(cpra_requests), len(email_contents))
+        
+        requests_text = _format_requests_block(tuple(cpra_requests))
+        emails_text = "\n\n".join(
+            f"===EMAIL {i+1}===\n{content}" for i, content in enumerate(email_contents)
+        )
+        
+        prompt = f"""Analyze each of the following emails for responsiveness to the CPRA request(s):
+
+CPRA REQUEST(S) TO ANALYZE:
+{requests_text}
+
+EMAIL DOCUMENTS TO ANALYZE:
+{emails_text}
+
+REMEMBER: Return exactly {len(email_contents)} assessment object(s), one per email, in order."""
+        
+        for attempt in range(retry_attempts):
+            response = ""
+            try:
+                response = self.generate_structured_response(
+                    model_name=model_name,
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    temperature=0.2,
+                    max_tokens=800 * len(email_contents),
+                    keep_alive=keep_alive
+                )
+                
+                if not response:
+                    self.logger.warning(f"Batch attempt {attempt + 1} returned no response")
+                    continue
+                
+                result = json.loads(self._extract_json_from_response(response))
+                email_results = result.get('emails') if isinstance(result, dict) else None
+                
+                if (isinstance(email_results, list)
+                        and len(email_results) == len(email_contents)
+                        and all(self._validate_responsiveness_result(r, len(cpra_requests)) for r in email_results)):
+                    return email_results
+                
+                self.logger.warning(f"Invalid batch response structure on attempt {attempt + 1}")
+                
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"Batch JSON parse error on attempt {attempt + 1}: {e}")
+                self.logger.debug(f"Raw response: {response}")
+            except Exception as e:
+                self.logger.error(f"Unexpected error in batch responsiveness analysis: {e}")
+                return None
+        
+        return None
+    
     def _validate_responsiveness_result(self, result: Dict, expected_length: int) -> bool:
         """
         Validate the structure of a responsiveness analysis result.
@@ -436,44 +681,7 @@ Analyze the email as a WHOLE DOCUMENT, not paragraph by paragraph."""
         Returns:
             Dictionary with exemption analysis results or None if failed
         """
-        system_prompt = """You are an expert legal assistant specializing in California Public Records Act (CPRA) exemptions.
-Your task is to identify potential exemptions that may apply to email content.
-
-EXEMPTION DEFINITIONS:
-
-1. ATTORNEY-CLIENT PRIVILEGE:
-   - Communications between attorney and client for legal advice
-   - Legal strategy discussions
-   - Attorney work product or legal analysis
-   - Must involve actual attorney-client relationship
-
-2. PERSONNEL RECORDS:
-   - Employee performance evaluations or reviews
-   - Disciplinary actions or investigations
-   - Personal employee information (medical, financial, private matters)
-   - HR-related confidential discussions about specific individuals
-
-3. DELIBERATIVE PROCESS:
-   - Pre-decisional discussions and recommendations
-   - Draft documents not yet finalized
-   - Internal policy discussions before final decisions
-   - Advisory opinions or preliminary analysis
-
-CONFIDENCE LEVELS:
-- "high": Clear, definitive indicators of exemption
-- "medium": Probable exemption with some indicators
-- "low": Possible exemption but uncertain
-
-You must respond with valid JSON only, using this exact format:
-{
-    "exemptions": {
-        "attorney_client": {"applies": true/false, "confidence": "high/medium/low", "reasoning": "brief explanation"},
-        "personnel": {"applies": true/false, "confidence": "high/medium/low", "reasoning": "brief explanation"},
-        "deliberative": {"applies": true/false, "confidence": "high/medium/low", "reasoning": "brief explanation"}
-    }
-}
-
-CRITICAL: Your response must be valid JSON with exactly the structure shown above."""
+        system_prompt = EXEMPTION_SYSTEM_PROMPT
         
         prompt = f"""Analyze this email for potential CPRA exemptions:
 
@@ -10,34 +10,46 @@ from typing import List, Optional, Tuple
 from email.utils import parsedate_to_datetime, parseaddr
 from dateutil import parser as date_parser
 
+try:
+    from fast_mail_parser import parse_email as _fast_parse_email
+except ImportError:  # Optional Rust-backed parser; fall back to the regex parser
+    _fast_parse_email = None
+
 from src.utils.data_structures import Email
 
 
+# Patterns are compiled once at import and shared by every parser instance
+
+# Common Outlook export patterns
+HEADER_PATTERNS = {
+    'from': re.compile(r'^From:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+    'to': re.compile(r'^To:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+    'cc': re.compile(r'^CC:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+    'bcc': re.compile(r'^BCC:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+    'subject': re.compile(r'^Subject:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+    'date': re.compile(r'^(?:Date|Sent):\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+    'message_id': re.compile(r'^Message-ID:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
+}
+
+# Email separation patterns
+EMAIL_SEPARATOR_PATTERNS = [
+    re.compile(r'^From:\s+', re.MULTILINE),  # Standard From: line
+    re.compile(r'^_{10,}', re.MULTILINE),    # Underline separator
+    re.compile(r'^-{10,}', re.MULTILINE),    # Dash separator
+    re.compile(r'^\s*(?:From|TO|Subject):\s+', re.MULTILINE | re.IGNORECASE),  # Header restart
+]
+
+ADDRESS_SEPARATOR_PATTERN = re.compile(r'[,;]')
+
+
 class EmailParser:
     """Parser for Outlook export format emails."""
     
     def __init__(self):
         """Initialize the email parser."""
         self.logger = logging.getLogger(__name__)
-        
-        # Common Outlook export patterns
-        self.header_patterns = {
-            'from': re.compile(r'^From:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-            'to': re.compile(r'^To:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-            'cc': re.compile(r'^CC:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-            'bcc': re.compile(r'^BCC:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-            'subject': re.compile(r'^Subject:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-            'date': re.compile(r'^(?:Date|Sent):\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-            'message_id': re.compile(r'^Message-ID:\s*(.+?)$', re.MULTILINE | re.IGNORECASE),
-        }
-        
-        # Email separation patterns
-        self.email_separator_patterns = [
-            re.compile(r'^From:\s+', re.MULTILINE),  # Standard From: line
-            re.compile(r'^_{10,}', re.MULTILINE),    # Underline separator
-            re.compile(r'^-{10,}', re.MULTILINE),    # Dash separator
-            re.compile(r'^\s*(?:From|TO|Subject):\s+', re.MULTILINE | re.IGNORECASE),  # Header restart
-        ]
+        self.header_patterns = HEADER_PATTERNS
+        self.email_separator_patterns = EMAIL_SEPARATOR_PATTERNS
     
     def parse_email_file(self, file_content: str) -> List[Email]:
         """
@@ -107,8 +119,7 @@ class EmailParser:
         # Try different splitting strategies
         
         # Strategy 1: Split by "From:" lines that start new emails
-        from_pattern = re.compile(r'^From:\s+', re.MULTILINE)
-        matches = list(from_pattern.finditer(content))
+        matches = list(self.email_separator_patterns[0].finditer(content))
         
         if len(matches) > 1:
             emails = []
@@ -141,6 +152,11 @@ class EmailParser:
         Returns:
             Parsed Email object or None if parsing fails
         """
+        if _fast_parse_email is not None:
+            email = self._parse_single_email_fast(raw_email, email_index)
+            if email:
+                return email
+        
         try:
             # Extract headers
             headers = self._extract_headers(raw_email)
@@ -183,6 +199,47 @@ class EmailParser:
             self.logger.error(f"Failed to parse single email: {e}")
             return None
     
+    def _parse_single_email_fast(self, raw_email: str, email_index: int = 0) -> Optional[Email]:
+        """
+        Parse a single email with fast_mail_parser.
+        
+        Args:
+            raw_email: Raw text of a single email
+            email_index: Index of email for ID generation
+            
+        Returns:
+            Parsed Email object, or None so the caller falls back to the
+            regex parser
+        """
+        try:
+            parsed = _fast_parse_email(raw_email.encode('utf-8'))
+        except Exception as e:
+            self.logger.debug(f"fast_mail_parser failed on email {email_index}: {e}")
+            return None
+        
+        headers = {name.lower(): value for name, value in (parsed.headers or {}).items()}
+        from_addr = self._parse_address(headers.get('from', ''))
+        to_addr = self._parse_address(headers.get('to', ''))
+        body = '\n'.join(parsed.text_plain or []).strip()
+        
+        # Outlook exports are not always valid RFC 822; let the regex parser handle them
+        if not from_addr or not to_addr or not body:
+            return None
+        
+        message_id = headers.get('message-id', '').strip()
+        return Email(
+            from_address=from_addr,
+            to_address=to_addr,
+            subject=(parsed.subject or '').strip(),
+            date=self._parse_date(headers.get('date') or headers.get('sent', '')),
+            body=body,
+            message_id=message_id if message_id else f"parsed_email_{email_index}",
+            cc_addresses=self._parse_address_list(headers.get('cc', '')),
+            bcc_addresses=self._parse_address_list(headers.get('bcc', '')),
+            raw_text=raw_email,
+            parsed_successfully=True
+        )
+    
     def _extract_headers(self, raw_email: str) -> dict:
         """Extract email headers from raw text."""
         headers = {}
@@ -202,13 +259,14 @@ class EmailParser:
         
         # Look for the first blank line after we've seen some headers
         found_headers = False
+        header_patterns = tuple(self.header_patterns.values())
         for i, line in enumerate(lines):
-            if any(pattern.match(line) for pattern in self.header_patterns.values()):
+            if any(pattern.match(line) for pattern in header_patterns):
                 found_headers = True
             elif found_headers and line.strip() == '':
                 body_start = i + 1
                 break
-            elif found_headers and not any(pattern.match(line) for pattern in self.header_patterns.values()):
+            elif found_headers:
                 # If we found headers but this line doesn't match any pattern and isn't blank,
                 # assume body starts here
                 body_start = i
@@ -244,7 +302,7 @@ class EmailParser:
             return []
         
         # Split by comma or semicolon
-        addresses = re.split(r'[,;]', addr_string)
+        addresses = ADDRESS_SEPARATOR_PATTERN.split(addr_string)
         return [self._parse_address(addr.strip()) for addr in addresses if addr.strip()]
     
     def _parse_date(self, date_string: str) -> datetime:
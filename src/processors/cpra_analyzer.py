@@ -143,6 +143,60 @@ class CPRAAnalyzer:
             self.logger.error(f"Error analyzing email responsiveness: {e}")
             return None
     
+    def analyze_emails_responsiveness_batch(
+        self,
+        emails: List[Email],
+        cpra_requests: List[CPRARequest],
+        start_index: int = 0
+    ) -> List[Optional[ResponsivenessAnalysis]]:
+        """
+        Analyze several emails for responsiveness with one model call.
+        
+        The CPRA requests and instructions are sent once for the whole group.
+        If the model's batch response cannot be used, each email is analyzed
+        individually instead.
+        
+        Args:
+            emails: Email objects to analyze together
+            cpra_requests: List of CPRA request objects
+            start_index: Index of the first email, used for email IDs
+            
+        Returns:
+            List of ResponsivenessAnalysis objects (None where analysis failed),
+            in the same order as emails
+        """
+        start_time = time.time()
+        request_texts = [req.text for req in cpra_requests]
+        
+        self.logger.info(f"Analyzing {len(emails)} emails in one batch against {len(request_texts)} CPRA requests")
+        
+        batch_results = self.ollama_client.analyze_responsiveness_batch(
+            model_name=self.model_name,
+            email_contents=[email.get_display_text() for email in emails],
+            cpra_requests=request_texts
+        )
+        
+        if not batch_results:
+            self.logger.warning("Batch analysis failed, falling back to per-email analysis")
+            return [
+                self.analyze_email_responsiveness(email, cpra_requests, start_index + offset)
+                for offset, email in enumerate(emails)
+            ]
+        
+        # Attribute the batch time evenly across its emails
+        per_email_time = (time.time() - start_time) / len(emails)
+        results: List[Optional[ResponsivenessAnalysis]] = [None] * len(emails)
+        for offset, (email, analysis_result) in enumerate(zip(emails, batch_results)):
+            email_id = email.message_id if email.message_id else f"email_{start_index + offset}"
+            results[offset] = self._parse_responsiveness_result(
+                email_id=email_id,
+                cpra_requests=request_texts,
+                analysis_result=analysis_result,
+                processing_time=per_email_time
+            )
+        
+        return results
+    
     def analyze_batch_responsiveness(
         self,
         emails: List[Email],
@@ -3,6 +3,7 @@ Session Manager for CPRA document processing.
 Handles session persistence, recovery, and state management.
 """
 
+import gzip
 import json
 import pickle
 import logging
@@ -10,6 +11,16 @@ from pathlib import Path
 from typing import Dict, Optional, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional speedup; fall back to gzip for compressed saves
+    zstandard = None
+
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -41,7 +52,7 @@ class SessionManager:
         
         Args:
             session: ProcessingSession to save
-            format: Save format ('json' or 'pickle')
+            format: Save format ('json', 'compressed' or 'pickle')
             
         Returns:
             Path to saved session file
@@ -53,6 +64,10 @@ class SessionManager:
         if format == "json":
             filepath = self.data_dir / f"{session_id}.json"
             self._save_session_json(session, filepath)
+        elif format == "compressed":
+            suffix = ".json.zst" if zstandard is not None else ".json.gz"
+            filepath = self.data_dir / f"{session_id}{suffix}"
+            self._save_session_compressed(session, filepath)
         elif format == "pickle":
             filepath = self.data_dir / f"{session_id}.pkl"
             self._save_session_pickle(session, filepath)
@@ -81,6 +96,8 @@ class SessionManager:
         try:
             if filepath.suffix == ".json":
                 return self._load_session_json(filepath)
+            elif filepath.suffixes[-2:] in ([".json", ".zst"], [".json", ".gz"]):
+                return self._load_session_compressed(filepath)
             elif filepath.suffix == ".pkl":
                 return self._load_session_pickle(filepath)
             else:
@@ -90,15 +107,17 @@ class SessionManager:
             self.logger.error(f"Error loading session: {e}")
             return None
     
-    def _save_session_json(self, session: ProcessingSession, filepath: Path) -> None:
+    def _session_to_dict(self, session: ProcessingSession) -> Dict[str, Any]:
         """
-        Save session as JSON (human-readable format).
+        Convert a session to a JSON-serializable dictionary.
         
         Args:
-            session: ProcessingSession to save
-            filepath: Path to save file
+            session: ProcessingSession to convert
+            
+        Returns:
+            Dictionary representation of the session
         """
-        data = {
+        return {
             "session_id": session.session_id,
             "model_used": session.model_used,
             "timestamp": datetime.now().isoformat(),
@@ -109,23 +128,17 @@ class SessionManager:
             "document_reviews": self._serialize_document_reviews(session.document_reviews),
             "stats": self._serialize_stats(session.stats)
         }
-        
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
     
-    def _load_session_json(self, filepath: Path) -> ProcessingSession:
+    def _session_from_dict(self, data: Dict[str, Any]) -> ProcessingSession:
         """
-        Load session from JSON file.
+        Rebuild a session from its dictionary representation.
         
         Args:
-            filepath: Path to JSON file
+            data: Dictionary produced by _session_to_dict
             
         Returns:
             ProcessingSession object
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
         session = ProcessingSession(
             session_id=data.get("session_id", ""),
             model_used=data.get("model_used", "")
@@ -141,6 +154,87 @@ class SessionManager:
         
         return session
     
+    def _save_session_json(self, session: ProcessingSession, filepath: Path) -> None:
+        """
+        Save session as JSON (human-readable format).
+        
+        Args:
+            session: ProcessingSession to save
+            filepath: Path to save file
+        """
+        data = self._session_to_dict(session)
+        
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+    
+    def _load_session_json(self, filepath: Path) -> ProcessingSession:
+        """
+        Load session from JSON file.
+        
+        Args:
+            filepath: Path to JSON file
+            
+        Returns:
+            ProcessingSession object
+        """
+        if orjson is not None:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+        
+        return self._session_from_dict(data)
+    
+    def _save_session_compressed(self, session: ProcessingSession, filepath: Path) -> None:
+        """
+        Save session as compact, compressed JSON (fast format).
+        
+        Uses zstd when zstandard is installed and gzip otherwise.
+        
+        Args:
+            session: ProcessingSession to save
+            filepath: Path to save file
+        """
+        data = self._session_to_dict(session)
+        
+        if orjson is not None:
+            payload = orjson.dumps(data, default=str)
+        else:
+            payload = json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+        
+        if filepath.suffix == ".zst":
+            payload = zstandard.ZstdCompressor(level=3).compress(payload)
+        else:
+            payload = gzip.compress(payload, compresslevel=1)
+        
+        filepath.write_bytes(payload)
+    
+    def _load_session_compressed(self, filepath: Path) -> ProcessingSession:
+        """
+        Load session from a compressed JSON file.
+        
+        Args:
+            filepath: Path to .json.zst or .json.gz file
+            
+        Returns:
+            ProcessingSession object
+        """
+        payload = filepath.read_bytes()
+        
+        if filepath.suffix == ".zst":
+            if zstandard is None:
+                raise ImportError("zstandard is required to load .json.zst sessions")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        else:
+            payload = gzip.decompress(payload)
+        
+        data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        return self._session_from_dict(data)
+    
     def _save_session_pickle(self, session: ProcessingSession, filepath: Path) -> None:
         """
         Save session as pickle (binary format, preserves all object types).
@@ -150,7 +244,7 @@ class SessionManager:
             filepath: Path to save file
         """
         with open(filepath, 'wb') as f:
-            pickle.dump(session, f)
+            pickle.dump(session, f, protocol=pickle.HIGHEST_PROTOCOL)
     
     def _load_session_pickle(self, filepath: Path) -> ProcessingSession:
         """
@@ -403,6 +497,10 @@ class SessionManager:
         sessions = []
         for filepath in self.data_dir.glob("*.json"):
             sessions.append(str(filepath))
+        for filepath in self.data_dir.glob("*.json.zst"):
+            sessions.append(str(filepath))
+        for filepath in self.data_dir.glob("*.json.gz"):
+            sessions.append(str(filepath))
         for filepath in self.data_dir.glob("*.pkl"):
             sessions.append(str(filepath))
         return sorted(sessions)
@@ -528,6 +626,17 @@ if __name__ == "__main__":
             print(f"  - CPRA Requests: {len(loaded_session_pkl.cpra_requests)}")
             print(f"  - Reviews: {len(loaded_session_pkl.document_reviews)}")
         
+        # Test compressed save/load
+        print("\nTesting compressed save/load...")
+        compressed_path = session_manager.save_session(session, format="compressed")
+        print(f"Saved session to: {compressed_path}")
+        
+        loaded_session_zst = session_manager.load_session(compressed_path)
+        if loaded_session_zst:
+            print(f"Loaded session: {loaded_session_zst.session_id}")
+            print(f"  - Emails: {len(loaded_session_zst.emails)}")
+            print(f"  - Reviews: {len(loaded_session_zst.document_reviews)}")
+        
         # List all sessions
         print("\nAll saved sessions:")
         sessions = session_manager.list_sessions()
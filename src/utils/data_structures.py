@@ -86,13 +86,22 @@ class ResponsivenessAnalysis:
     analysis_timestamp: datetime = field(default_factory=datetime.now)
     processing_time_seconds: Optional[float] = None
     
+    # Cached result of is_responsive_to_any(); None until computed
+    _is_responsive: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._is_responsive = any(self.responsive)
+    
     def get_responsive_requests(self) -> List[int]:
         """Get indices of requests that this email is responsive to."""
         return [i for i, resp in enumerate(self.responsive) if resp]
     
     def is_responsive_to_any(self) -> bool:
         """Check if email is responsive to any request."""
-        return any(self.responsive)
+        # Objects unpickled from older sessions fall back to the class default
+        if self._is_responsive is None:
+            self._is_responsive = any(self.responsive)
+        return self._is_responsive
 
 
 @dataclass
@@ -136,7 +145,11 @@ class ExemptionAnalysis:
     
     def has_any_exemption(self) -> bool:
         """Check if any exemption applies to this email."""
-        return len(self.get_applicable_exemptions()) > 0
+        return bool(
+            self.attorney_client["applies"]
+            or self.personnel["applies"]
+            or self.deliberative["applies"]
+        )
 
 
 @dataclass
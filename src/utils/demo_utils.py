@@ -18,16 +18,20 @@ import psutil
 import streamlit as st
 
 
+@st.cache_data(ttl=5, show_spinner=False)
 def check_network_connectivity() -> Tuple[bool, str]:
     """
     Check if network connectivity is available.
     
+    The probe can block for up to a second, so the result is reused for a
+    few seconds across the sidebar and resource panel redraws.
+    
     Returns:
         Tuple of (is_connected, status_message)
     """
     try:
         # Try to create a socket connection to common DNS servers
-        socket.create_connection(("8.8.8.8", 53), timeout=1)
+        socket.create_connection(("8.8.8.8", 53), timeout=1).close()
         return True, "Online"
     except (socket.error, socket.timeout):
         return False, "Offline (Airplane Mode)"
@@ -48,10 +52,13 @@ def get_system_resources() -> Dict[str, float]:
     }
 
 
+@st.cache_data(max_entries=1, show_spinner=False)
 def load_demo_data() -> Tuple[str, List[str]]:
     """
     Load demonstration data from demo-files directory.
     
+    The demo files are static, so the result is cached across reruns.
+    
     Returns:
         Tuple of (email_content, cpra_requests)
     """
@@ -115,7 +122,8 @@ def load_demo_data() -> Tuple[str, List[str]]:
     return email_content, cpra_requests
 
 
-def simulate_processing_delay(demo_mode: bool, base_delay: float = 0.5, speed_multiplier: float = 1.0):
+def simulate_processing_delay(demo_mode: bool, base_delay: float = 0.5, speed_multiplier: float = 1.0,
+                              elapsed: float = 0.0):
     """
     Add configurable delay for visual impact during demo.
     
@@ -123,10 +131,12 @@ def simulate_processing_delay(demo_mode: bool, base_delay: float = 0.5, speed_mu
         demo_mode: Whether demo mode is active
         base_delay: Base delay in seconds
         speed_multiplier: Speed multiplier (0.5 = half speed, 2.0 = double speed)
+        elapsed: Seconds already spent on real work, deducted from the delay
     """
     if demo_mode:
-        actual_delay = base_delay / speed_multiplier
-        time.sleep(actual_delay)
+        actual_delay = base_delay / speed_multiplier - elapsed
+        if actual_delay > 0:
+            time.sleep(actual_delay)
 
 
 def typewriter_effect(text: str, container, demo_mode: bool, speed: float = 0.03):
@@ -1,49 +1,324 @@
 """
 Debug the exact CPRA analysis call.
+
+Run from the repository root:
+    python -m tests.integration.debug_cpra_call [email_count | sweep]
 """
 
 import sys
 import os
+import json
+import asyncio
+import atexit
+import functools
+import hashlib
 import logging
-sys.path.append('src')
+import logging.handlers
+import pickle
+import queue
+from pathlib import Path
+import httpx
+
+from src.config.app_config import get_config
+from src.models.ollama_client import OllamaClient
+from src.parsers.email_parser import EmailParser
+from src.processors.cpra_analyzer import create_sample_cpra_requests
+
+# Debug inputs are deterministic, so cached responses never expire
+CACHE_FILE = Path(".cache/cpra/debug_responses.json")
+EMAILS_CACHE_FILE = Path(".cache/cpra/emails.pkl")
+SAMPLE_EMAILS_PATH = "data/sample_emails/test_emails.txt"
+RESULTS_FILE = Path("data/debug_results.jsonl")
+
+# Set CPRA_DEBUG_MODEL to try a smaller model (e.g. gemma3:1b); unset to roll back
+DEBUG_MODEL = os.environ.get("CPRA_DEBUG_MODEL", get_config().model.responsiveness_model)
+
+# Every request resets Ollama's unload timer, so preload and analysis calls
+# must pass the same keep_alive for the model to stay loaded between calls
+DEBUG_KEEP_ALIVE = "10m"
+
+# Shared client so keep-alive connections survive repeated debug calls
+_CLIENT = None
+
+
+def _configure_logging(level):
+    """
+    Route log records through a background thread so terminal writes do not
+    stall the analysis call.
+    
+    Args:
+        level: Root logging level
+    """
+    root = logging.getLogger()
+    root.setLevel(level)
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+    
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(get_config().logging.log_format))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # HTTP internals log every request at DEBUG; set CPRA_DEBUG_HTTP=1 to see them
+    if not os.environ.get("CPRA_DEBUG_HTTP"):
+        for name in ("httpx", "httpcore", "urllib3", "ollama"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def get_client():
+    """Return the process-wide Ollama client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = OllamaClient(
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60)
+        )
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+@functools.lru_cache(maxsize=4)
+def _load_emails(path, mtime):
+    """
+    Parse an email export, reusing a pickled copy while the file is unchanged.
+    
+    Args:
+        path: Path to the email export file
+        mtime: Modification time of the file, used to invalidate the cache
+        
+    Returns:
+        List of parsed Email objects
+    """
+    try:
+        with open(EMAILS_CACHE_FILE, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('path') == path and cached.get('mtime') == mtime:
+            return cached['emails']
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    
+    with open(path, 'r') as f:
+        emails = EmailParser().parse_email_file(f.read())
+    
+    EMAILS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(EMAILS_CACHE_FILE, 'wb') as f:
+        pickle.dump({'path': path, 'mtime': mtime, 'emails': emails}, f)
+    return emails
+
+
+@functools.lru_cache(maxsize=1)
+def _sample_requests():
+    """Return the sample CPRA requests, built once per process."""
+    return tuple(create_sample_cpra_requests())
+
+
+def _cache_key(model_name, email_content, request_texts):
+    """
+    Build the exact-match cache key for an analysis call.
+    
+    Requests are hashed in their given order because the cached verdict
+    arrays are aligned with it.
+    """
+    raw = "\x1f".join([model_name, email_content, *request_texts])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _load_cache():
+    """Load cached responses, returning an empty cache if none exist."""
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache):
+    """Persist cached responses to disk."""
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+
+def _print_stream(event_type, content, metadata):
+    """Echo model output to the terminal as tokens arrive."""
+    if event_type == 'response_chunk':
+        print(content, end='', flush=True)
+    elif event_type == 'processing_start':
+        print(f"--- streaming (attempt {metadata.get('attempt', 1)}) ---", flush=True)
+    elif event_type == 'response_complete':
+        print(flush=True)
 
-from models.ollama_client import OllamaClient
-from parsers.email_parser import EmailParser
-from processors.cpra_analyzer import create_sample_cpra_requests
 
 def debug_cpra_call():
     """Debug the exact CPRA analysis call."""
-    logging.basicConfig(level=logging.DEBUG)
+    _configure_logging(logging.DEBUG)
     
-    client = OllamaClient()
+    client = get_client()
     
     # Load sample email
-    email_parser = EmailParser()
-    with open("data/sample_emails/test_emails.txt", 'r') as f:
-        emails = email_parser.parse_email_file(f.read())
+    emails = _load_emails(SAMPLE_EMAILS_PATH, os.path.getmtime(SAMPLE_EMAILS_PATH))
     
     test_email = emails[0]
-    cpra_requests = create_sample_cpra_requests()
+    cpra_requests = _sample_requests()
     request_texts = [req.text for req in cpra_requests]
+    model_name = DEBUG_MODEL
+    email_content = test_email.get_display_text()
     
     print("Testing exact CPRA analysis call...")
     print(f"Email: {test_email.subject}")
     print(f"Requests: {len(request_texts)}")
     
+    cache = _load_cache()
+    key = _cache_key(model_name, email_content, request_texts)
+    if key in cache:
+        print(f"Result (cached): {cache[key]}")
+        return
+    
+    # Warm the model so the call below only pays decode cost
+    client.preload_model(model_name, keep_alive=DEBUG_KEEP_ALIVE)
+    
     try:
         result = client.analyze_responsiveness(
-            model_name="gemma3:latest",
-            email_content=test_email.get_display_text(),
+            model_name=model_name,
+            email_content=email_content,
             cpra_requests=request_texts,
-            retry_attempts=1
+            retry_attempts=1,
+            keep_alive=DEBUG_KEEP_ALIVE,
+            stream_callback=_print_stream
         )
         
         print(f"Result: {result}")
         
+        # Only cache successful analyses so failures are retried next run
+        if result:
+            cache[key] = result
+            _save_cache(cache)
+        
     except Exception as e:
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
 
+
+async def _analyze_all(client, emails, request_texts, model_name):
+    """
+    Analyze several emails concurrently against the same CPRA requests.
+    
+    Args:
+        client: Shared Ollama client
+        emails: Emails to analyze
+        request_texts: CPRA request strings
+        model_name: Model to use for analysis
+        
+    Returns:
+        List of analysis results in the same order as emails
+    """
+    # Cap in-flight calls so Ollama's parallel slots are not oversubscribed
+    semaphore = asyncio.Semaphore(get_config().processing.max_concurrent_requests)
+    
+    async def analyze(email):
+        async with semaphore:
+            return await asyncio.to_thread(
+                client.analyze_responsiveness,
+                model_name=model_name,
+                email_content=email.get_display_text(),
+                cpra_requests=request_texts,
+                retry_attempts=1,
+                keep_alive=DEBUG_KEEP_ALIVE
+            )
+    
+    return await asyncio.gather(*(analyze(email) for email in emails))
+
+
+def debug_cpra_batch(email_count):
+    """Debug the CPRA analysis call across the first email_count sample emails."""
+    emails = _load_emails(SAMPLE_EMAILS_PATH, os.path.getmtime(SAMPLE_EMAILS_PATH))[:email_count]
+    if len(emails) <= 1:
+        debug_cpra_call()
+        return
+    
+    _configure_logging(logging.INFO)
+    request_texts = [req.text for req in _sample_requests()]
+    cache = _load_cache()
+    keys = [_cache_key(DEBUG_MODEL, email.get_display_text(), request_texts) for email in emails]
+    pending = [email for email, key in zip(emails, keys) if key not in cache]
+    
+    if pending:
+        get_client().preload_model(DEBUG_MODEL, keep_alive=DEBUG_KEEP_ALIVE)
+    print(f"Analyzing {len(pending)} of {len(emails)} emails ({len(emails) - len(pending)} cached)...")
+    results = asyncio.run(_analyze_all(get_client(), pending, request_texts, DEBUG_MODEL))
+    
+    for email, result in zip(pending, results):
+        if result:
+            cache[_cache_key(DEBUG_MODEL, email.get_display_text(), request_texts)] = result
+    _save_cache(cache)
+    
+    for email, key in zip(emails, keys):
+        print(f"{email.subject}: {cache.get(key)}")
+
+
+def run_debug_sweep(emails, results_path=RESULTS_FILE):
+    """
+    Analyze every email, appending each result to a JSONL checkpoint file.
+    
+    Emails already recorded for the current model are skipped, so an
+    interrupted sweep resumes where it stopped.
+    
+    Args:
+        emails: Emails to analyze
+        results_path: JSONL file holding one result per line
+        
+    Returns:
+        Number of emails analyzed in this run
+    """
+    _configure_logging(logging.INFO)
+    request_texts = [req.text for req in _sample_requests()]
+    
+    seen = set()
+    if results_path.exists():
+        with open(results_path, 'r') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial line from an interrupted write
+                seen.add((row.get('id'), row.get('model')))
+    
+    pending = [
+        (email.message_id or f"email_{i}", email)
+        for i, email in enumerate(emails)
+        if (email.message_id or f"email_{i}", DEBUG_MODEL) not in seen
+    ]
+    print(f"Sweeping {len(pending)} of {len(emails)} emails ({len(emails) - len(pending)} already done)...")
+    if not pending:
+        return 0
+    
+    client = get_client()
+    client.preload_model(DEBUG_MODEL, keep_alive=DEBUG_KEEP_ALIVE)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(results_path, 'a') as f:
+        for email_id, email in pending:
+            result = client.analyze_responsiveness(
+                model_name=DEBUG_MODEL,
+                email_content=email.get_display_text(),
+                cpra_requests=request_texts,
+                retry_attempts=1,
+                keep_alive=DEBUG_KEEP_ALIVE
+            )
+            f.write(json.dumps({'id': email_id, 'model': DEBUG_MODEL, 'result': result}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            print(f"{email.subject}: {result}")
+    
+    return len(pending)
+
+
 if __name__ == "__main__":
-    debug_cpra_call()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        run_debug_sweep(_load_emails(SAMPLE_EMAILS_PATH, os.path.getmtime(SAMPLE_EMAILS_PATH)))
+    elif len(sys.argv) > 1:
+        debug_cpra_batch(int(sys.argv[1]))
+    else:
+        debug_cpra_call()
\ No newline at end of file
@@ -195,6 +195,60 @@ class TestCPRAAnalyzer:
         assert stats.analysis_errors == 1
         assert stats.responsive_emails == 1
     
+    def test_multi_email_batch_analysis_success(self):
+        """Test analyzing several emails with a single batched model call."""
+        self.mock_client.analyze_responsiveness_batch.return_value = [
+            {
+                "responsive": [True, False],
+                "confidence": ["high", "low"],
+                "reasoning": ["Discusses roof issues", "No change orders mentioned"]
+            },
+            {
+                "responsive": [False, True],
+                "confidence": ["low", "medium"],
+                "reasoning": ["No roof content", "Mentions change order process"]
+            }
+        ]
+        
+        emails = [
+            self.create_test_email("Roof Issues", "Roof leak problems"),
+            self.create_test_email("Change Orders", "Processing change order #3")
+        ]
+        emails[1].message_id = None
+        
+        results = self.analyzer.analyze_emails_responsiveness_batch(
+            emails, self.create_test_cpra_requests(), start_index=4
+        )
+        
+        assert self.mock_client.analyze_responsiveness_batch.call_count == 1
+        self.mock_client.analyze_responsiveness.assert_not_called()
+        assert [r.responsive for r in results] == [[True, False], [False, True]]
+        assert results[0].email_id == "test_email_001"
+        assert results[1].email_id == "email_5"
+    
+    def test_multi_email_batch_analysis_falls_back_per_email(self):
+        """Test per-email fallback when the batched call fails."""
+        self.mock_client.analyze_responsiveness_batch.return_value = None
+        self.mock_client.analyze_responsiveness.side_effect = [
+            {
+                "responsive": [True, False],
+                "confidence": ["high", "low"],
+                "reasoning": ["Valid analysis", "No relevance"]
+            },
+            None
+        ]
+        
+        emails = [
+            self.create_test_email("Success Email"),
+            self.create_test_email("Failure Email")
+        ]
+        
+        results = self.analyzer.analyze_emails_responsiveness_batch(emails, self.create_test_cpra_requests())
+        
+        assert self.mock_client.analyze_responsiveness.call_count == 2
+        assert results[0].responsive == [True, False]
+        assert results[1] is None
+    
     def test_parse_responsiveness_result_success(self):
         """Test successful parsing of responsiveness result.""" 
         analysis_result = {
@@ -339,6 +393,28 @@ class TestOllamaClientEnhancements:
         is_valid = self.client._validate_responsiveness_result(result, 3)
         assert is_valid is True
     
+    def test_analyze_responsiveness_batch_valid(self):
+        """Test that a well-formed batched response is split per email."""
+        response = '{"emails": [' + ', '.join(
+            ['{"responsive": [true], "confidence": ["high"], "reasoning": ["Match"]}'] * 2
+        ) + ']}'
+        
+        with patch.object(self.client, 'generate_structured_response', return_value=response):
+            results = self.client.analyze_responsiveness_batch("gemma3:latest", ["email 1", "email 2"], ["request"])
+        
+        assert results == [{"responsive": [True], "confidence": ["high"], "reasoning": ["Match"]}] * 2
+    
+    def test_analyze_responsiveness_batch_wrong_email_count(self):
+        """Test that a batched response with the wrong number of emails is rejected."""
+        response = '{"emails": [{"responsive": [true], "confidence": ["high"], "reasoning": ["Match"]}]}'
+        
+        with patch.object(self.client, 'generate_structured_response', return_value=response):
+            results = self.client.analyze_responsiveness_batch(
+                "gemma3:latest", ["email 1", "email 2"], ["request"], retry_attempts=2
+            )
+        
+        assert results is None
+    
     def test_validate_responsiveness_result_missing_keys(self):
         """Test validation with missing required keys."""
         result = {
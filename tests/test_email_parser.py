@@ -8,6 +8,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from parsers.email_parser import EmailParser, create_sample_outlook_export
 from utils.data_structures import Email
 
@@ -200,6 +202,98 @@ Line 3 of body"""
             assert any("PERSONNEL CONFIDENTIAL" in subject for subject in subjects)
 
 
+class TestFastEmailParser:
+    """Test cases for the fast_mail_parser path of EmailParser."""
+    
+    RAW_EMAIL = """From: test@example.com
+To: recipient@example.com
+Subject: Test Subject
+Date: Mon, 1 Jan 2024 12:00:00 -0800
+
+This is a test email body."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = EmailParser()
+    
+    def make_parsed(self, headers, subject="Test Subject", text_plain=None):
+        """Build a minimal stand-in for a fast_mail_parser result."""
+        return SimpleNamespace(
+            headers=headers,
+            subject=subject,
+            text_plain=text_plain if text_plain is not None else ["This is a test email body.\n"]
+        )
+    
+    def test_maps_parsed_email_fields(self):
+        """Test mapping headers, body and date from the fast parser."""
+        parsed = self.make_parsed({
+            'From': 'John Doe <test@example.com>',
+            'To': 'recipient@example.com',
+            'Cc': 'cc1@example.com, cc2@example.com',
+            'Date': 'Mon, 1 Jan 2024 12:00:00 -0800',
+            'Message-ID': '<abc123@example.com>'
+        })
+        
+        with patch('parsers.email_parser._fast_parse_email', Mock(return_value=parsed)) as fast_parse:
+            email = self.parser._parse_single_email_fast(self.RAW_EMAIL, 3)
+        
+        fast_parse.assert_called_once_with(self.RAW_EMAIL.encode('utf-8'))
+        assert email is not None
+        assert email.from_address == "test@example.com"
+        assert email.to_address == "recipient@example.com"
+        assert email.cc_addresses == ["cc1@example.com", "cc2@example.com"]
+        assert email.subject == "Test Subject"
+        assert email.body == "This is a test email body."
+        assert email.date.year == 2024
+        assert email.date.month == 1
+        assert email.date.day == 1
+        assert email.date.hour == 12
+        assert email.message_id == "<abc123@example.com>"
+        assert email.raw_text == self.RAW_EMAIL
+        assert email.parsed_successfully == True
+    
+    def test_message_id_fallback(self):
+        """Test generating a message ID when the header is missing."""
+        parsed = self.make_parsed({
+            'From': 'test@example.com',
+            'To': 'recipient@example.com',
+            'Sent': 'Mon, 1 Jan 2024 12:00:00 -0800'
+        })
+        
+        with patch('parsers.email_parser._fast_parse_email', Mock(return_value=parsed)):
+            email = self.parser._parse_single_email_fast(self.RAW_EMAIL, 3)
+        
+        assert email is not None
+        assert email.message_id == "parsed_email_3"
+        assert email.date.year == 2024
+    
+    def test_incomplete_result_returns_none(self):
+        """Test rejecting fast parser results without a body."""
+        parsed = self.make_parsed(
+            {'From': 'test@example.com', 'To': 'recipient@example.com'},
+            text_plain=[]
+        )
+        
+        with patch('parsers.email_parser._fast_parse_email', Mock(return_value=parsed)):
+            assert self.parser._parse_single_email_fast(self.RAW_EMAIL) is None
+    
+    def test_falls_back_to_regex_parser(self):
+        """Test falling back to the regex parser when the fast parser raises."""
+        fast_parse = Mock(side_effect=ValueError("not RFC 822"))
+        
+        with patch('parsers.email_parser._fast_parse_email', fast_parse):
+            assert self.parser._parse_single_email_fast(self.RAW_EMAIL) is None
+            email = self.parser._parse_single_email(self.RAW_EMAIL)
+        
+        assert fast_parse.call_count == 2
+        assert email is not None
+        assert email.from_address == "test@example.com"
+        assert email.to_address == "recipient@example.com"
+        assert email.subject == "Test Subject"
+        assert email.body == "This is a test email body."
+        assert email.parsed_successfully == True
+
+
 class TestEmail:
     """Test cases for Email data structure."""
     
@@ -25,11 +25,12 @@ from src.config import get_config, reset_config
 from src.parsers.email_parser import EmailParser
 from src.processors.cpra_analyzer import CPRAAnalyzer
 from src.processors.review_manager import ReviewManager
+from src.processors import session_manager as session_manager_module
 from src.processors.session_manager import SessionManager
 from src.processors.export_manager import ExportManager
 from src.utils.data_structures import (
     Email, ProcessingSession, CPRARequest,
-    ReviewStatus
+    ReviewStatus, ResponsivenessAnalysis, ConfidenceLevel
 )
 
 
@@ -432,5 +433,82 @@ class TestErrorHandling(unittest.TestCase):
             review_manager.finalize_review("nonexistent_id")
 
 
+class TestSessionPersistence(unittest.TestCase):
+    """Test session save and load round trips."""
+    
+    def setUp(self):
+        """Create a session manager in a temporary directory."""
+        self.test_dir = tempfile.mkdtemp(prefix="cpra_sessions_")
+        self.session_manager = SessionManager(data_dir=self.test_dir)
+        
+        with open("data/sample_emails/test_emails.txt", 'r', encoding='utf-8') as f:
+            emails = EmailParser().parse_email_file(f.read())
+        
+        self.session = ProcessingSession(
+            session_id="compressed_test",
+            cpra_requests=[CPRARequest(text="Roof repair records", request_id="request_0")],
+            emails=emails,
+            model_used="gemma3:latest"
+        )
+        self.session.responsiveness_results["email_0"] = ResponsivenessAnalysis(
+            email_id="email_0",
+            cpra_requests=["Roof repair records"],
+            responsive=[True],
+            confidence=[ConfidenceLevel.HIGH],
+            reasoning=["Discusses the roof repair"]
+        )
+    
+    def tearDown(self):
+        """Remove the temporary session directory."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def assertSessionRoundTrip(self, session_path):
+        """Load a saved session and compare it with the original."""
+        loaded_session = self.session_manager.load_session(session_path)
+        
+        self.assertIsNotNone(loaded_session)
+        self.assertEqual(loaded_session.session_id, self.session.session_id)
+        self.assertEqual(loaded_session.model_used, self.session.model_used)
+        self.assertEqual(len(loaded_session.emails), len(self.session.emails))
+        self.assertEqual(
+            [email.subject for email in loaded_session.emails],
+            [email.subject for email in self.session.emails]
+        )
+        self.assertEqual(loaded_session.cpra_requests[0].text, "Roof repair records")
+        loaded_result = loaded_session.responsiveness_results["email_0"]
+        self.assertEqual(loaded_result.responsive, [True])
+        self.assertEqual(loaded_result.confidence[0].value, "high")
+        self.assertIn(session_path, self.session_manager.list_sessions())
+    
+    def test_compressed_session_round_trip(self):
+        """Test compressed save and load with the available compressor."""
+        session_path = self.session_manager.save_session(self.session, format="compressed")
+        
+        expected_suffix = ".json.zst" if session_manager_module.zstandard is not None else ".json.gz"
+        self.assertTrue(session_path.endswith(expected_suffix))
+        self.assertSessionRoundTrip(session_path)
+    
+    def test_compressed_session_gzip_fallback(self):
+        """Test compressed save and load when zstandard is not installed."""
+        with patch.object(session_manager_module, 'zstandard', None):
+            session_path = self.session_manager.save_session(self.session, format="compressed")
+            
+            self.assertTrue(session_path.endswith(".json.gz"))
+            self.assertSessionRoundTrip(session_path)
+    
+    def test_compressed_session_without_orjson(self):
+        """Test compressed save and load with the standard library JSON encoder."""
+        with patch.object(session_manager_module, 'orjson', None):
+            session_path = self.session_manager.save_session(self.session, format="compressed")
+            self.assertSessionRoundTrip(session_path)
+    
+    def test_compressed_session_smaller_than_json(self):
+        """Test that the compressed format is smaller than the indented JSON format."""
+        json_path = self.session_manager.save_session(self.session, format="json")
+        compressed_path = self.session_manager.save_session(self.session, format="compressed")
+        
+        self.assertLess(Path(compressed_path).stat().st_size, Path(json_path).stat().st_size)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file